@@ -127,12 +127,18 @@ from static_frame.core.util import CONTINUATION_TOKEN_INACTIVE
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DEFAULT_STABLE_SORT_KIND
+from static_frame.core.util import DEFAULT_WRITE_BUFFER_SIZE
 from static_frame.core.util import DT64_NS
 from static_frame.core.util import DTU_PYARROW
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_COMPLEX_DEFAULT
 from static_frame.core.util import DTYPE_DATETIME_KIND
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_INEXACT_KINDS
 from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_NAT_KINDS
 from static_frame.core.util import DTYPE_NA_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_OBJECT_KIND
@@ -180,6 +186,7 @@ from static_frame.core.util import UFunc
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argsort_head
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import blocks_to_array_2d
@@ -201,6 +208,7 @@ from static_frame.core.util import key_normalize
 from static_frame.core.util import path_filter
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import ufunc_unique1d
+from static_frame.core.util import ufunc_unique1d_indexer
 from static_frame.core.util import ufunc_unique_enumerated
 from static_frame.core.util import write_optional_file
 
@@ -3398,6 +3406,24 @@ class Frame(ContainerOperand):
                 f'Columns has incorrect size (got {self._blocks.shape[1]}, expected {col_count})'
                 )
 
+    @classmethod
+    def _from_blocks_owned(cls,
+            blocks: TypeBlocks,
+            *,
+            index: IndexBase,
+            columns: IndexBase,
+            name: NameType = None,
+            ) -> tpe.Self:
+        '''
+        Private constructor for when ``blocks``, ``index``, and ``columns`` are already aligned, of the appropriate types, and can be owned. This bypasses the normalization and validation of ``__init__``.
+        '''
+        obj = cls.__new__(cls)
+        obj._blocks = blocks
+        obj._index = index
+        obj._columns = columns
+        obj._name = name
+        return obj
+
     #---------------------------------------------------------------------------
 
     def __deepcopy__(self, memo: tp.Dict[int, tp.Any]) -> tpe.Self:
@@ -4021,25 +4047,31 @@ class Frame(ContainerOperand):
         col_key_many: TILocSelectorMany
         row_key_many: TILocSelectorMany
 
+        def extract_target(index: IndexBase, key: TILocSelectorMany) -> IndexBase:
+            # NOTE: for a full selection of an immutable index, use the index directly, avoiding creating a new index and permitting identity checks in reindexing
+            if index.STATIC and (key is None or (key.__class__ is slice and key == NULL_SLICE)):
+                return index
+            return index._extract_iloc(key) # type: ignore
+
         if nm_row and not nm_column:
             # only column is multi selection, reindex by column
             if is_series:
                 col_key_many = col_key # type: ignore[assignment]
-                v = value.reindex(self._columns._extract_iloc(col_key_many),
+                v = value.reindex(extract_target(self._columns, col_key_many),
                         fill_value=fill_value)
         elif not nm_row and nm_column:
             # only row is multi selection, reindex by index
             if is_series:
                 row_key_many = row_key # type: ignore[assignment]
-                v = value.reindex(self._index._extract_iloc(row_key_many),
+                v = value.reindex(extract_target(self._index, row_key_many),
                         fill_value=fill_value)
         elif not nm_row and not nm_column:
             # both multi, must be a Frame
             if is_frame:
                 col_key_many = col_key # type: ignore[assignment]
                 row_key_many = row_key # type: ignore[assignment]
-                target_column_index = self._columns._extract_iloc(col_key_many)
-                target_row_index = self._index._extract_iloc(row_key_many)
+                target_column_index = extract_target(self._columns, col_key_many)
+                target_row_index = extract_target(self._index, row_key_many)
                 # this will use the default fillna type, which may or may not be what is wanted
                 v = value.reindex( # type: ignore
                         index=target_row_index,
@@ -5666,23 +5698,27 @@ class Frame(ContainerOperand):
                     index_group = (index._extract_iloc(selection) if ordering is None
                             else index._extract_iloc(ordering[selection])
                             )
-                    yield group, self.__class__(tb,
-                            index=index_group,
-                            columns=columns,
-                            own_columns=self.STATIC, # own if static
-                            own_index=True,
-                            own_data=True)
+                    if self.STATIC:
+                        # all components are immutable and aligned; skip validation
+                        yield group, self._from_blocks_owned(tb,
+                                index=index_group,
+                                columns=columns,
+                                )
+                    else: # columns cannot be shared between grow-only groups
+                        yield group, self.__class__(tb,
+                                index=index_group,
+                                columns=columns,
+                                own_index=True,
+                                own_data=True)
                 else:
                     # axis 1 is a column iterators, so need to slice columns, keep index
                     columns_group = (columns._extract_iloc(selection) if ordering is None
                             else columns._extract_iloc(ordering[selection])
                             )
-                    yield group, self.__class__(tb,
+                    yield group, self._from_blocks_owned(tb,
                             index=index,
                             columns=columns_group,
-                            own_index=True,
-                            own_columns=True,
-                            own_data=True)
+                            )
 
 
     def _axis_group_iloc_items(self,
@@ -6087,9 +6123,9 @@ class Frame(ContainerOperand):
             {key}
         '''
         order = sort_index_for_order(self._index, kind=kind, ascending=ascending, key=key)
-        index = self._index[order]
-
-        blocks = self._blocks.iloc[order]
+        # NOTE: call extractors directly to avoid creating an iloc interface and re-dispatching
+        index = self._index._extract_iloc(order)
+        blocks = self._blocks._extract(row_key=order)
         return self.__class__(blocks,
                 index=index,
                 columns=self._columns,
@@ -6114,10 +6150,9 @@ class Frame(ContainerOperand):
             {key}
         '''
         order = sort_index_for_order(self._columns, kind=kind, ascending=ascending, key=key)
-
-        columns = self._columns[order]
-
-        blocks = self._blocks[order]
+        # NOTE: call extractors directly to avoid __getitem__ re-dispatching
+        columns = self._columns._extract_iloc(order)
+        blocks = self._blocks._extract(column_key=order)
         return self.__class__(blocks,
                 index=self._index,
                 columns=columns,
@@ -6134,6 +6169,7 @@ class Frame(ContainerOperand):
             axis: int = 1,
             kind: TSortKinds = DEFAULT_SORT_KIND,
             key: tp.Optional[tp.Callable[[tp.Union['Frame', Series]], tp.Union[NDArrayAny, 'Series', 'Frame']]] = None,
+            count: tp.Optional[int] = None,
             ) -> tpe.Self:
         '''
         Return a new :obj:`Frame` ordered by the sorted values, where values are given by single column or iterable of columns.
@@ -6145,6 +6181,7 @@ class Frame(ContainerOperand):
             axis: Axis upon which to sort; 0 orders columns based on one or more rows; 1 orders rows based on one or more columns.
             {kind}
             {key}
+            count: If provided, only return the first ``count`` rows (for axis 1) or columns (for axis 0) of the sorted result. When sorting by a single row or column, this avoids a full sort.
         '''
         values_for_sort: NDArrayAny | tp.List[NDArrayAny] | None = None
         values_for_lex: OptionalArrayList = None
@@ -6214,18 +6251,28 @@ class Frame(ContainerOperand):
                 values_for_lex=values_for_lex,
                 )
 
-        if values_for_lex is not None:
-            order = np.lexsort(values_for_lex)
-        elif values_for_sort is not None:
-            order = np.argsort(values_for_sort, kind=kind)
+        if count is not None and values_for_sort is not None and asc_is_element:
+            order = argsort_head(values_for_sort,
+                    count,
+                    ascending=ascending, # type: ignore
+                    kind=kind,
+                    )
+        else:
+            if values_for_lex is not None:
+                order = np.lexsort(values_for_lex)
+            elif values_for_sort is not None:
+                order = np.argsort(values_for_sort, kind=kind)
+
+            if asc_is_element and not ascending:
+                # NOTE: if asc is not an element, then ascending Booleans have already been applied to values_for_lex
+                # NOTE: putting the order in reverse, not invetering the selection, produces the descending sort
+                order = order[::-1]
 
-        if asc_is_element and not ascending:
-            # NOTE: if asc is not an element, then ascending Booleans have already been applied to values_for_lex
-            # NOTE: putting the order in reverse, not invetering the selection, produces the descending sort
-            order = order[::-1]
+            if count is not None:
+                order = order[:count]
 
         if axis == 0:
-            columns = self._columns[order]
+            columns = self._columns._extract_iloc(order)
             blocks = self._blocks._extract(column_key=order) # order columns
             return self.__class__(blocks,
                     index=self._index,
@@ -6236,7 +6283,7 @@ class Frame(ContainerOperand):
                     own_index=True,
                     )
 
-        index = self._index[order]
+        index = self._index._extract_iloc(order)
         blocks = self._blocks._extract(row_key=order)
         return self.__class__(blocks,
                 index=index,
@@ -7322,7 +7369,6 @@ class Frame(ContainerOperand):
         '''
         # if this has NaN can continue
         post = argmin_2d(self.values, skipna=skipna, axis=axis)
-        post.flags.writeable = False
         if axis == 0:
             return Series(post, index=immutable_index_filter(self._columns))
         return Series(post, index=self._index)
@@ -7365,7 +7411,6 @@ class Frame(ContainerOperand):
         '''
         # if this has NaN can continue
         post = argmax_2d(self.values, skipna=skipna, axis=axis)
-        post.flags.writeable = False
         if axis == 0:
             return Series(post, index=immutable_index_filter(self._columns))
         return Series(post, index=self._index)
@@ -8321,11 +8366,11 @@ class Frame(ContainerOperand):
         import pandas
 
         if self._blocks.unified and self._blocks._blocks:
-            # make copy to get writeable
-            array = self._blocks._blocks[0].copy()
-            df = pandas.DataFrame(array,
+            # NOTE: let pandas make the only copy (to get writeable); pandas will copy into its preferred (columnar) layout, and with copy-on-write defaults would otherwise copy a second time
+            df = pandas.DataFrame(self._blocks._blocks[0],
                     index=self._index.to_pandas(),
-                    columns=self._columns.to_pandas()
+                    columns=self._columns.to_pandas(),
+                    copy=True,
                     )
         else:
             df = pandas.DataFrame(index=self._index.to_pandas())
@@ -8483,11 +8528,25 @@ class Frame(ContainerOperand):
             coords = {index_name: index.values}
         else:
             index_name = index.names
-            # index values are reduced to unique values for 2d presentation
-            coords = {index_name[d]: ufunc_unique1d(index.values_at_depth(d))
-                    for d in range(index.depth)}
-            # create dictionary version
-            coords_index = {k: Index(v) for k, v in coords.items()}
+            # index values are reduced to unique values for 2d presentation; retain, for each depth, the position of each label in the unique values
+            coords = {}
+            coords_indexers = []
+            na_merged = False
+            for d in range(index.depth):
+                values, indexer = ufunc_unique1d_indexer(index.values_at_depth(d))
+                # NaN and NaT do not compare equal and are each retained as unique; merge them into the first such value
+                isna = isna_array(values, include_none=False)
+                if isna.sum() > 1:
+                    na_first = np.argmax(isna)
+                    keep = ~isna
+                    keep[na_first] = True
+                    remap = np.cumsum(keep) - 1
+                    remap[isna] = remap[na_first]
+                    values = values[keep]
+                    indexer = remap[indexer]
+                    na_merged = True
+                coords[index_name[d]] = values
+                coords_indexers.append(indexer)
 
         # columns form the keys in data_vars dict
         columns_values: tp.Iterable[tp.Any]
@@ -8499,23 +8558,21 @@ class Frame(ContainerOperand):
             columns_values = array2d_to_tuples(columns.values)
 
             def columns_arrays() -> tp.Iterator[NDArrayAny]:
-                c: Series
-                for c in self.iter_series(axis=0): #type: ignore
+                shape = [len(coords[v]) for v in coords]
+                # translate each row's per-depth positions to a position in the flattened array once for all columns
+                insert_pos = np.ravel_multi_index(coords_indexers, shape)
+                if na_merged and len(ufunc_unique1d(insert_pos)) != len(insert_pos):
+                    raise ErrorInitIndexNonUnique('Index labels are not unique once NaN and NaT labels are merged.')
+
+                for values in self._blocks.axis_values(0):
                     # dtype must be able to accomodate a float NaN
-                    resolved = resolve_dtype(c.dtype, DTYPE_FLOAT_DEFAULT)
-                    # create multidimensional arsdfray of all axis for each
+                    resolved = resolve_dtype(values.dtype, DTYPE_FLOAT_DEFAULT)
+                    # create multidimensional array of all axis for each
                     array = np.full(
-                            shape=[len(coords[v]) for v in coords],
+                            shape=shape,
                             fill_value=np.nan,
                             dtype=resolved)
-
-                    for index_labels, value in c.items():
-                        # translate to index positions
-                        insert_pos = [coords_index[k]._loc_to_iloc(label)
-                                for k, label in zip(coords, index_labels)]
-                        # must convert to tuple to give position per dimension
-                        array[tuple(insert_pos)] = value
-
+                    array.reshape(-1)[insert_pos] = values
                     yield array
 
         data_vars = {k: (index_name, v)
@@ -8701,11 +8758,41 @@ class Frame(ContainerOperand):
 
         if store_filter:
             filter_func = store_filter.from_type_filter_element
+        # NOTE: evaluate once, rather than for each converted array
+        inexact_unformatted = not (store_filter and store_filter._value_format_active)
+
+        def to_str(array: NDArrayAny) -> tp.List[str]:
+            '''Convert a 1D array to a list of strings.
+            '''
+            dtype = array.dtype
+            kind = dtype.kind
+            # NOTE: for these kinds, astype(str) matches f-string formatting of NumPy scalars, and a store filter makes no changes
+            if kind in DTYPE_INT_KINDS or kind == DTYPE_BOOL_KIND or kind == 'U':
+                return array.astype(str).tolist() # type: ignore
+            if kind in DTYPE_INEXACT_KINDS and inexact_unformatted:
+                if dtype == DTYPE_FLOAT_DEFAULT or dtype == DTYPE_COMPLEX_DEFAULT:
+                    post = array.astype(str).tolist()
+                else: # f-string formatting of float16, float32, and complex64 scalars does not match astype(str)
+                    post = [f'{e}' for e in array]
+                if store_filter: # only NaN and infinities can be replaced
+                    for i in np.nonzero(~np.isfinite(array))[0]:
+                        post[i] = f'{filter_func(array[i])}'
+                return post # type: ignore
+            if kind in DTYPE_NAT_KINDS:
+                post = array.astype(str).tolist()
+                if store_filter: # only NaT can be replaced
+                    for i in np.nonzero(np.isnat(array))[0]:
+                        post[i] = f'{filter_func(array[i])}'
+                return post # type: ignore
+            if store_filter:
+                return [f'{filter_func(e)}' for e in array]
+            return [f'{e}' for e in array]
 
-        columns_rows: tp.Iterable[tp.Iterable[tp.Any]]
+        columns_rows: tp.Iterable[NDArrayAny]
         if include_columns:
+            # NOTE: iterate over the labels array rather than the index
             if columns.depth == 1:
-                columns_rows = (columns,)
+                columns_rows = (columns.values,)
             else:
                 columns_rows = columns.values.T
 
@@ -8725,42 +8812,26 @@ class Frame(ContainerOperand):
                     else:
                         row.extend(('' for _ in range(index_depth)))
                 # write the rest of the line
-                if store_filter:
-                    row.extend(f'{filter_func(x)}' for x in columns_row)
-                else:
-                    row.extend(f'{x}' for x in columns_row)
+                row.extend(to_str(columns_row))
                 yield row
 
-        col_idx_last = self._blocks._index.columns - 1
-        # avoid row creation to avoid joining types; avoide creating a list for each row
-        row_current_idx: tp.Optional[int] = None
+        if not self._blocks._index.columns:
+            return # index labels are not written without values
 
-        for (row_idx, col_idx), element in self._iter_element_iloc_items():
-            if row_idx != row_current_idx: # each new row
-                if row_current_idx is not None: # if not the first
-                    yield row
-                row = []
-                if include_index:
-                    if index_depth == 1:
-                        index_value = index_values[row_idx]
-                        if store_filter:
-                            row.append(f'{filter_func(index_value)}')
-                        else:
-                            row.append(f'{index_value}')
-                    else:
-                        for index_value in index_values[row_idx]:
-                            if store_filter:
-                                row.append(f'{filter_func(index_value)}')
-                            else:
-                                row.append(f'{index_value}')
-                row_current_idx = row_idx
-            if store_filter:
-                row.append(f'{filter_func(element)}')
+        arrays: tp.List[NDArrayAny] = []
+        if include_index:
+            if index_depth == 1:
+                arrays.append(index_values)
             else:
-                row.append(f'{element}')
+                arrays.extend(index_values[NULL_SLICE, d] for d in range(index_depth))
+        arrays.extend(self._blocks.axis_values(0))
 
-        if row_current_idx is not None:
-            yield row
+        # convert column-wise in row chunks to bound the number of strings held at once
+        count = self._blocks._index.rows
+        chunk_size = 4096
+        for start in range(0, count, chunk_size):
+            key = slice(start, start + chunk_size)
+            yield from map(list, zip(*(to_str(a[key]) for a in arrays)))
 
     @doc_inject(selector='delimited')
     def to_delimited(self,
@@ -8798,7 +8869,11 @@ class Frame(ContainerOperand):
             {quoting}
             {store_filter}
         '''
-        with file_like_manager(fp, encoding=encoding, mode='w') as fl:
+        with file_like_manager(fp,
+                encoding=encoding,
+                mode='w',
+                buffering=DEFAULT_WRITE_BUFFER_SIZE,
+                ) as fl:
             csvw = csv.writer(fl, # type: ignore
                     delimiter=delimiter,
                     escapechar=escape_char,
@@ -8807,14 +8882,14 @@ class Frame(ContainerOperand):
                     quoting=quoting,
                     doublequote=quote_double,
                     )
-            for row in self._to_str_records(
+            # NOTE: writerows iterates and writes records without a Python-level loop
+            csvw.writerows(self._to_str_records(
                     include_index=include_index,
                     include_index_name=include_index_name,
                     include_columns=include_columns,
                     include_columns_name=include_columns_name,
                     store_filter=store_filter,
-                    ):
-                csvw.writerow(row)
+                    ))
 
     @doc_inject(selector='delimited')
     def to_csv(self,
@@ -9230,17 +9305,8 @@ class FrameGO(Frame):
 
         row_count = len(self._index)
 
-        if isinstance(value, Series):
-            # select only the values matching our index
-            block = value.reindex(self.index, fill_value=fill_value).values
-        elif isinstance(value, Index):
-            if len(value) != row_count:
-                raise RuntimeError(f'incorrectly sized unindexed value: {len(value)} != {row_count}')
-            block = value.values
-        elif isinstance(value, Frame):
-            raise RuntimeError(
-                    f'cannot use setitem with a Frame; use {self.__class__.__name__}.extend()')
-        elif value.__class__ is np.ndarray:
+        # NOTE: check for an array first, as it is the most common case, and an identity check on the class is cheaper than isinstance checks
+        if value.__class__ is np.ndarray:
             # this permits unaligned assignment as no index is used, possibly remove
             if value.ndim != 1:
                 raise RuntimeError('can only use setitem with 1D containers')
@@ -9248,7 +9314,18 @@ class FrameGO(Frame):
                 # block may have zero shape if created without columns
                 raise RuntimeError(f'incorrectly sized unindexed value: {len(value)} != {row_count}')
             block = value
-
+        elif isinstance(value, Series):
+            if value._index is self._index:
+                block = value.values
+            else: # select only the values matching our index
+                block = value.reindex(self._index, fill_value=fill_value).values
+        elif isinstance(value, Index):
+            if len(value) != row_count:
+                raise RuntimeError(f'incorrectly sized unindexed value: {len(value)} != {row_count}')
+            block = value.values
+        elif isinstance(value, Frame):
+            raise RuntimeError(
+                    f'cannot use setitem with a Frame; use {self.__class__.__name__}.extend()')
         else:
             if not hasattr(value, '__iter__') or isinstance(value, str):
                 block = np.full(row_count, value)
@@ -9270,7 +9347,18 @@ class FrameGO(Frame):
         '''
         Given an iterable of pairs of column name, column value, extend this FrameGO. Columns values can be any iterable suitable for usage in __setitem__.
         '''
+        index = self._index
+        # as Series values frequently share an Index, retain the last Index found equal to this index, permitting values to be used without reindexing or repeated comparison
+        index_aligned: tp.Optional[IndexBase] = None
+
         for k, v in pairs:
+            if isinstance(v, Series):
+                v_index = v._index
+                if v_index is index or v_index is index_aligned:
+                    v = v.values
+                elif v_index.equals(index):
+                    index_aligned = v_index
+                    v = v.values
             self.__setitem__(k, v, fill_value)
 
     def extend(self,
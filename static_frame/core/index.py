@@ -249,6 +249,22 @@ class Index(IndexBase):
         '''
         return cls(labels, name=name)
 
+    @classmethod
+    def _from_positions(cls: tp.Type[I],
+            positions: NDArrayAny,
+            ) -> I:
+        '''
+        Construct a static, loc_is_iloc ``Index`` from an immutable array of contiguous ascending integers (as provided by ``PositionsAllocator``), bypassing the initializer's general handling of labels.
+        '''
+        assert cls.STATIC and cls._DTYPE is None
+        obj = cls.__new__(cls)
+        obj._recache = False
+        obj._map = None
+        obj._argsort_cache = None
+        obj._name = None
+        obj._labels = positions
+        obj._positions = positions
+        return obj
 
     @staticmethod
     def _error_init_index_non_unique(
@@ -1578,6 +1594,16 @@ class IndexGO(_IndexGOMixin, Index):
     _IMMUTABLE_CONSTRUCTOR = Index
     __slots__ = INDEX_GO_LEAF_SLOTS
 
+    def __contains__(self, value: tp.Any) -> bool:
+        '''Return True if value in the labels.
+        '''
+        if self._map is None: # loc_is_iloc
+            # NOTE: use the mutable count to avoid a recache when testing membership after appends
+            if isinstance(value, INT_TYPES):
+                return value >= 0 and value < self._positions_mutable_count #type: ignore
+            return False
+        return self._map.__contains__(value) #type: ignore
+
 
 # update class attr on Index after class initialziation
 Index._MUTABLE_CONSTRUCTOR = IndexGO
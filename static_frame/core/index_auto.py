@@ -129,8 +129,9 @@ class IndexAutoFactory:
 
         else: # get from default constructor
             assert default_constructor is not None
-            constructor = Index if default_constructor.STATIC else IndexGO # type: ignore
-            return constructor(
+            if default_constructor.STATIC: # type: ignore
+                return Index._from_positions(labels)
+            return IndexGO(
                     labels=labels,
                     loc_is_iloc=True,
                     dtype=DTYPE_INT_DEFAULT
@@ -11,12 +11,16 @@ from static_frame.core.index import Index
 from static_frame.core.index import mutable_immutable_index_filter
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.loc_map import HierarchicalLocMap
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_NAN_NAT_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_UINT_DEFAULT
 from static_frame.core.util import IndexConstructor
 from static_frame.core.util import ManyToOneType
 from static_frame.core.util import TLabel
 from static_frame.core.util import intersect1d
+from static_frame.core.util import isin_array
+from static_frame.core.util import isna_array
 from static_frame.core.util import setdiff1d
 from static_frame.core.util import ufunc_unique1d
 from static_frame.core.util import ufunc_unique1d_indexer
@@ -27,6 +31,7 @@ if tp.TYPE_CHECKING:
 
 class ValidationResult(tp.NamedTuple):
     indices: tp.List[IndexHierarchy]
+    sizes: tp.List[int] # length of each retained index, parallel to `indices`
     depth: int
     any_dropped: bool
     any_shallow_copies: bool
@@ -54,17 +59,19 @@ def _validate_and_process_indices(
 
     unique_signatures: tp.Set[TLabel] = set()
     unique_non_empty_indices: tp.List[IndexHierarchy] = []
+    sizes: tp.List[int] = []
 
     depth: tp.Optional[int] = None
     for idx in indices:
         if name is not None and idx.name != name:
             name = None
 
-        if index_constructors:
-            for ctor, other_ctor in zip(idx._index_constructors, index_constructors):
-                if other_ctor != ctor:
-                    index_constructors = []
-                    break
+        if index_constructors and idx is not indices[0]:
+            ctors = [index.__class__ for index in idx._indices]
+            # compare only shared depths; depth mismatches are raised below
+            shared = min(len(ctors), len(index_constructors))
+            if ctors[:shared] != index_constructors[:shared]:
+                index_constructors = []
 
         # Drop empty indices
         if not idx.size:
@@ -80,6 +87,7 @@ def _validate_and_process_indices(
 
         if signature not in unique_signatures:
             unique_non_empty_indices.append(idx)
+            sizes.append(len(idx))
             unique_signatures.add(signature)
         else:
             any_shallow_copies = True
@@ -88,6 +96,7 @@ def _validate_and_process_indices(
 
     return ValidationResult(
             indices=unique_non_empty_indices,
+            sizes=sizes,
             depth=depth,
             any_dropped=any_dropped,
             any_shallow_copies=any_shallow_copies,
@@ -108,6 +117,21 @@ def get_encoding_invariants(indices: tp.List[Index]
     return bit_offset_encoders, encoding_dtype
 
 
+def get_dense_encoding_size(
+        union_indices: tp.List[Index],
+        bit_offset_encoders: NDArrayAny,
+        encoding_dtype: DtypeAny,
+        count: int,
+        ) -> int:
+    '''
+    Return the size of a table covering all possible encodings if that size is small relative to `count` encodings, otherwise return 0. In that case, marking presence in a Boolean table finds sorted unique encodings in linear time, faster than sorting.
+    '''
+    if encoding_dtype is DTYPE_OBJECT:
+        return 0
+    size: int = 1 << (int(bit_offset_encoders[-1]) + len(union_indices[-1]).bit_length())
+    return size if size <= count * 2 else 0
+
+
 def get_empty(
         index_constructors: tp.List[IndexConstructor],
         name: TLabel,
@@ -142,61 +166,121 @@ def _get_encodings(
         ih: IndexHierarchy,
         *,
         union_indices: tp.List[Index],
-        depth: int,
         bit_offset_encoders: NDArrayAny,
         encoding_dtype: DtypeAny,
+        out: tp.Optional[NDArrayAny] = None,
         ) -> NDArrayAny:
-    '''Encode `ih` based on the union indices'''
-    remapped_indexers: tp.List[NDArrayAny] = []
+    '''Encode `ih` based on the union indices. If `out` is provided, encodings are written into it.'''
+    encodings = np.empty(len(ih), dtype=encoding_dtype) if out is None else out
 
     union_idx: Index
     idx: Index
     indexer: NDArrayAny
-    depth_level = list(range(depth))
     for ( # type: ignore
         union_idx,
         idx,
-        indexer
+        indexer,
+        bit_offset,
     ) in zip(
         union_indices,
-        ih.index_at_depth(depth_level),
-        ih.indexer_at_depth(depth_level)
+        ih._indices,
+        ih._indexers, # rows of the 2D indexers are views, avoiding a fancy-indexed copy
+        bit_offset_encoders.tolist(),
     ):
         # 2. For each depth, for each index, remap the indexers to the shared base.
-        indexer_remap_key = idx._index_iloc_map(union_idx)
-        remapped_indexers.append(indexer_remap_key[indexer])
+        # NOTE: shifting the remap key, which has one element per label, before selecting with the indexer encodes in the same pass as the remap, without building a 2-D array of indexers
+        indexer_remap_key = idx._index_iloc_map(union_idx).astype(encoding_dtype)
+        if bit_offset == 0: # the first depth initializes the encodings
+            np.take(indexer_remap_key, indexer, out=encodings)
+        else:
+            encodings |= (indexer_remap_key << bit_offset)[indexer]
 
-    return HierarchicalLocMap.encode(
-            np.array(remapped_indexers, dtype=encoding_dtype).T,
-            bit_offset_encoders,
-            )
+    return encodings
+
+
+def _get_encodings_reference(
+        ih: IndexHierarchy,
+        *,
+        reference_indices: tp.List[Index],
+        bit_offset_encoders: NDArrayAny,
+        encoding_dtype: DtypeAny,
+        ) -> NDArrayAny:
+    '''Encode `ih` based on the reference indices, dropping any label with a component not found in the reference indices.'''
+    encodings = np.zeros(len(ih), dtype=encoding_dtype)
+    found_rows: tp.Optional[NDArrayAny] = None
+
+    ref_idx: Index
+    idx: Index
+    indexer: NDArrayAny
+    for ( # type: ignore
+        ref_idx,
+        idx,
+        indexer,
+        bit_offset,
+    ) in zip(
+        reference_indices,
+        ih._indices,
+        ih._indexers, # rows of the 2D indexers are views, avoiding a fancy-indexed copy
+        bit_offset_encoders.tolist(),
+    ):
+        if idx is ref_idx:
+            indexer_remap_key = np.arange(len(idx), dtype=encoding_dtype)
+        else:
+            found = isin_array(
+                    array=idx.values,
+                    array_is_unique=True,
+                    other=ref_idx.values,
+                    other_is_unique=True,
+                    )
+            indexer_remap_key = np.zeros(len(idx), dtype=encoding_dtype)
+            # NOTE: NaN and NaT never compare equal, so they are not found by isin_array nor mapped by _index_iloc_map; pair them with the reference NaN or NaT directly
+            na = isna_array(idx.values) if idx.dtype.kind in DTYPE_NAN_NAT_KINDS else None
+            if na is not None and na.any():
+                ref_na = np.flatnonzero(isna_array(ref_idx.values))
+                if len(ref_na):
+                    indexer_remap_key[na] = ref_na[0]
+                    found = found | na
+                indexer_remap_key[found & ~na] = idx._extract_iloc(found & ~na)._index_iloc_map(ref_idx)
+            else:
+                indexer_remap_key[found] = idx._extract_iloc(found)._index_iloc_map(ref_idx)
+            if not found.all():
+                found_rows = found[indexer] if found_rows is None else found_rows & found[indexer]
+
+        encodings |= (indexer_remap_key << bit_offset)[indexer]
+
+    if found_rows is not None:
+        return encodings[found_rows]
+    return encodings
 
 
 def _remove_union_bloat(
         indices: tp.List[Index],
-        indexers: tp.List[NDArrayAny] | NDArrayAny,
+        indexers: NDArrayAny,
         ) -> tp.Tuple[tp.List[Index], NDArrayAny]:
     # There is potentially a LOT of leftover bloat from all the unions. Clean up.
     final_indices: tp.List[Index] = []
-    final_indexers: tp.List[NDArrayAny] = []
+    # NOTE: `indexers` is an immutable 2-D array; only copy it if an indexer at some depth changes
+    final_indexers: tp.Optional[NDArrayAny] = None
 
     index: Index
     indexer: NDArrayAny
 
-    for index, indexer in zip(indices, indexers):
+    for depth, (index, indexer) in enumerate(zip(indices, indexers)):
         unique, new_indexer = ufunc_unique1d_indexer(indexer)
 
         if len(unique) == len(index):
             final_indices.append(index)
-            final_indexers.append(indexer)
         else:
             final_indices.append(index._extract_iloc(unique))
-            final_indexers.append(new_indexer)
+            if final_indexers is None:
+                final_indexers = indexers.astype(DTYPE_UINT_DEFAULT)
+            final_indexers[depth] = new_indexer
 
-    final_indexers_arr = np.array(final_indexers, dtype=DTYPE_UINT_DEFAULT)
-    final_indexers_arr.flags.writeable = False
+    if final_indexers is None:
+        return final_indices, indexers
 
-    return final_indices, final_indexers_arr
+    final_indexers.flags.writeable = False
+    return final_indices, final_indexers
 
 
 def index_hierarchy_intersection(*indices: IndexHierarchy) -> IndexHierarchy:
@@ -209,8 +293,8 @@ def index_hierarchy_intersection(*indices: IndexHierarchy) -> IndexHierarchy:
 
     Algorithm:
 
-        1. Determine the union of the depth-level indices for each index.
-        2. For each index, remap `indexers_at_depth` using the shared union base.
+        1. Determine the shared base: the depth-level indices of the smallest index if all depth-level indices are aligned, otherwise the union of the depth-level indices.
+        2. For each index, remap `indexers_at_depth` using the shared base, discarding labels not in the shared base.
         3. Convert the 2-D indexers to 1-D encodings.
         4. Find the iterative intersection for each encoding.
             a. If the intersection is ever empty, we can stop!
@@ -236,24 +320,6 @@ def index_hierarchy_intersection(*indices: IndexHierarchy) -> IndexHierarchy:
         # If any index was empty, the intersection will also be empty
         return get_empty(args.index_constructors, args.name)
 
-    # 1. Find union_indices
-    union_indices = build_union_indices(
-            filtered_indices,
-            args.index_constructors,
-            args.depth,
-            )
-
-    # 2-3. Remap indexers and convert to encodings
-    bit_offset_encoders, encoding_dtype = get_encoding_invariants(union_indices)
-
-    get_encodings = partial(
-            _get_encodings,
-            union_indices=union_indices,
-            depth=args.depth,
-            bit_offset_encoders=bit_offset_encoders,
-            encoding_dtype=encoding_dtype,
-            )
-
     # For any two indices being compared, we will have `fewer comparisons and a `higher likelihood of
     # creating a `smaller index, if the second index is *as small as it can be*.
     #
@@ -268,13 +334,58 @@ def index_hierarchy_intersection(*indices: IndexHierarchy) -> IndexHierarchy:
     # Choose the smallest
     first_ih = filtered_indices.pop()
 
+    # 1. Find the shared base indices. Every label in the intersection must be in the smallest index,
+    # so if all depth-level indices are of the same class and dtype, the smallest index's depth-level
+    # indices can be used in place of the union indices; labels not found in them are discarded.
+    # NOTE: NaN in object arrays cannot be reliably distinguished from None, so such indices use the union indices
+    reference_indices = first_ih._indices
+    reference_aligned = not any(
+            ref_idx.dtype == DTYPE_OBJECT and isna_array(ref_idx.values).any()
+            for ref_idx in reference_indices
+            ) and all(
+            idx.__class__ is ref_idx.__class__ and idx.dtype == ref_idx.dtype
+            for ih in filtered_indices
+            for ref_idx, idx in zip(reference_indices, ih._indices)
+            )
+
+    union_indices: tp.List[Index]
+    get_encodings: tp.Callable[[IndexHierarchy], NDArrayAny]
+    if reference_aligned:
+        union_indices = list(reference_indices)
+        bit_offset_encoders, encoding_dtype = get_encoding_invariants(union_indices)
+        get_encodings = partial(
+                _get_encodings_reference,
+                reference_indices=union_indices,
+                bit_offset_encoders=bit_offset_encoders,
+                encoding_dtype=encoding_dtype,
+                )
+    else:
+        union_indices = build_union_indices(
+                filtered_indices + [first_ih],
+                args.index_constructors,
+                args.depth,
+                )
+        bit_offset_encoders, encoding_dtype = get_encoding_invariants(union_indices)
+        get_encodings = partial(
+                _get_encodings,
+                union_indices=union_indices,
+                bit_offset_encoders=bit_offset_encoders,
+                encoding_dtype=encoding_dtype,
+                )
+
+    # 2-3. Remap indexers and convert to encodings
     intersection_encodings = get_encodings(first_ih)
 
     while filtered_indices:
         next_encodings = get_encodings(filtered_indices.pop())
 
         # 4. Find the iterative intersection for each encodings.
-        intersection_encodings = intersect1d(intersection_encodings, next_encodings)
+        # NOTE: encodings of an IndexHierarchy are unique, permitting a single sort of the concatenated encodings
+        intersection_encodings = intersect1d(
+                intersection_encodings,
+                next_encodings,
+                assume_unique=True,
+                )
 
         if not intersection_encodings.size:
             # 4.a. If the intermediate intersection is ever empty, the end result must be empty
@@ -356,7 +467,6 @@ def index_hierarchy_difference(*indices: IndexHierarchy) -> IndexHierarchy:
     get_encodings = partial(
             _get_encodings,
             union_indices=union_indices,
-            depth=args.depth,
             bit_offset_encoders=bit_offset_encoders,
             encoding_dtype=encoding_dtype,
             )
@@ -373,6 +483,23 @@ def index_hierarchy_difference(*indices: IndexHierarchy) -> IndexHierarchy:
 
     difference_encodings = get_encodings(lhs)
 
+    dense_size = get_dense_encoding_size(
+            union_indices,
+            bit_offset_encoders,
+            encoding_dtype,
+            len(lhs) + sum(map(len, filtered_indices)),
+            )
+    if dense_size:
+        # 4. Mark the encodings of all other indices, then remove them in a single pass
+        present = np.zeros(dense_size, dtype=DTYPE_BOOL)
+        while filtered_indices:
+            present[get_encodings(filtered_indices.pop())] = True
+        # NOTE: sort to match the order returned by setdiff1d
+        difference_encodings = np.sort(difference_encodings[~present[difference_encodings]])
+
+        if not difference_encodings.size:
+            return get_empty(args.index_constructors, args.name)
+
     while filtered_indices:
         next_encodings = get_encodings(filtered_indices.pop())
 
@@ -444,16 +571,32 @@ def index_hierarchy_union(*indices: IndexHierarchy) -> IndexHierarchy:
     get_encodings = partial(
             _get_encodings,
             union_indices=union_indices,
-            depth=args.depth,
             bit_offset_encoders=bit_offset_encoders,
             encoding_dtype=encoding_dtype,
             )
 
-    union_encodings = list(map(get_encodings, filtered_indices))
+    # write the encodings of each index into a single array, avoiding concatenating per-index arrays
+    union_encodings = np.empty(sum(args.sizes), dtype=encoding_dtype)
+    start = 0
+    for ih, size in zip(filtered_indices, args.sizes):
+        get_encodings(ih, out=union_encodings[start: start + size])
+        start += size
     del filtered_indices
 
     # 4. Build up the union of the encodings (i.e., whatever encodings are unique)
-    union_array = ufunc_unique1d(np.hstack(union_encodings))
+    dense_size = get_dense_encoding_size(
+            union_indices,
+            bit_offset_encoders,
+            encoding_dtype,
+            len(union_encodings),
+            )
+    if dense_size:
+        present = np.zeros(dense_size, dtype=DTYPE_BOOL)
+        present[union_encodings] = True
+        union_array = np.flatnonzero(present).astype(DTYPE_UINT_DEFAULT)
+        union_array.flags.writeable = False
+    else:
+        union_array = ufunc_unique1d(union_encodings)
 
     if len(union_array) == len(lhs):
         # In unions, nothing can be dropped. If the size didn't change, then it means
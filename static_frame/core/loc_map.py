@@ -525,18 +525,17 @@ class HierarchicalLocMap:
 
         dtype = DTYPE_OBJECT if encoding_can_overflow else DTYPE_UINT_DEFAULT
 
-        starts = bit_offset_encoders
-        stops: NDArrayAny = np.empty(len(starts), dtype=dtype)
-        stops[:-1] = starts[1:]
-        stops[-1] = 64
-
-        lens = stops - starts
+        starts = bit_offset_encoders.astype(dtype)
+        # NOTE: all bits above the last offset belong to the last depth, so no mask is needed for it; using a stop of 64 would be incorrect when encodings overflow 64 bits
+        lens = starts[1:] - starts[:-1]
         masks = [x for x in (1 << lens) - 1]
 
         target = np.empty((len(bit_offset_encoders), len(encoded_arr)), dtype=DTYPE_UINT_DEFAULT)
 
-        for depth in range(len(bit_offset_encoders)):
+        last = len(bit_offset_encoders) - 1
+        for depth in range(last):
             target[depth] = (encoded_arr >> starts[depth]) & masks[depth]
+        target[last] = encoded_arr >> starts[last]
 
         target.flags.writeable = False
         return target
@@ -5,8 +5,11 @@ from collections import abc
 from itertools import chain
 from sys import getsizeof
 from typing import NamedTuple
+from weakref import WeakKeyDictionary
 
 import numpy as np
+from arraymap import AutoMap  # pylint: disable=E0611
+from arraymap import FrozenAutoMap  # pylint: disable=E0611
 
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.util import DTYPE_OBJECT_KIND
@@ -102,6 +105,36 @@ class MaterializedArray:
         return size
 
 
+# types that have neither iterable children nor slots, and are fully measured by getsizeof
+ATOMIC_TYPES = frozenset((
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        np.bool_,
+        np.int64,
+        np.float64,
+        np.datetime64,
+        np.timedelta64,
+        AutoMap,
+        FrozenAutoMap,
+        ))
+
+# types whose children are their elements and that have no slots
+BUILTIN_COLLECTION_TYPES = frozenset((
+        tuple,
+        list,
+        set,
+        frozenset,
+        ))
+
+# slot names per class, collected along the MRO; weak keys permit classes to be collected
+_SLOT_NAMES: tp.MutableMapping[type, tp.Tuple[str, ...]] = WeakKeyDictionary()
+_UNSET = object()
+
+
 class MemoryMeasure:
 
     @staticmethod
@@ -127,13 +160,19 @@ class MemoryMeasure:
         '''
         Generates an iterable of the values of all slot-based attributes in an object, including the slots contained in the object's parent classes based on the MRO
         '''
-        # NOTE: This does NOT support 'single-string' slots (i.e. __slots__ = 'foo')
-        slots = chain.from_iterable(
-                cls.__slots__ for cls in obj.__class__.__mro__
-                if hasattr(cls, '__slots__'))
-        attrs = (getattr(obj, slot) for slot in slots
-                if slot != '__weakref__' and hasattr(obj, slot))
-        yield from attrs
+        cls = obj.__class__
+        try:
+            slots = _SLOT_NAMES[cls]
+        except KeyError:
+            # NOTE: This does NOT support 'single-string' slots (i.e. __slots__ = 'foo')
+            slots = _SLOT_NAMES[cls] = tuple(slot
+                    for slot in chain.from_iterable(
+                        c.__slots__ for c in cls.__mro__ if hasattr(c, '__slots__'))
+                    if slot != '__weakref__')
+        for slot in slots:
+            attr = getattr(obj, slot, _UNSET)
+            if attr is not _UNSET:
+                yield attr
 
     @classmethod
     def nested_sizable_elements(cls,
@@ -144,36 +183,48 @@ class MemoryMeasure:
             ) -> tp.Iterator[tp.Any]:
         '''
         Generates an iterable of all objects the parent object has references to, including nested references. This function considers both the iterable unsized children (based on _iter_iterable) and the sizable
-        attributes listed in its slots. The resulting generator is in pre-order and includes the parent object at the end.
+        attributes listed in its slots. The resulting generator is in post-order, yielding each object after its children and the parent object at the end.
         '''
-        from static_frame.core.container import ContainerBase
-
-        if id(obj) in seen:
-            return
-        seen.add(id(obj))
-
-        if obj.__class__ is np.ndarray:
-            if format.materialized:
-                obj = MaterializedArray(obj, format=format)
-            else: # non-object arrays report included elements
-                if obj.dtype.kind == DTYPE_OBJECT_KIND:
-                    for el in cls._iter_iterable(obj):
-                        yield from cls.nested_sizable_elements(el, seen=seen, format=format)
-                if not format.local_only and obj.base is not None:
-                    # include the base array for numpy slices / views only if that base has not been seen
-                    yield from cls.nested_sizable_elements(obj.base, seen=seen, format=format)
-            yield obj
-
-        elif obj.__class__ is MaterializedArray:
-            yield obj
-
-        else:
-            for el in cls._iter_iterable(obj): # will not yield if no __iter__
-                yield from cls.nested_sizable_elements(el, seen=seen, format=format)
-            # arrays do not have slots
-            for el in cls._iter_slots(obj):
-                yield from cls.nested_sizable_elements(el, seen=seen, format=format)
-            yield obj
+        # NOTE: an explicit stack of (children, component) pairs replaces recursive generators, which re-yield every nested element through each enclosing frame
+        stack: tp.List[tp.Tuple[tp.Iterator[tp.Any], tp.Any]] = []
+        exhausted = object()
+        node = obj
+
+        while True:
+            if id(node) not in seen:
+                seen.add(id(node))
+
+                if node.__class__ in ATOMIC_TYPES: # no children: yield without building iterators
+                    yield node
+                elif node.__class__ in BUILTIN_COLLECTION_TYPES: # iterable children, no slots
+                    stack.append((iter(node), node))
+                elif node.__class__ is dict:
+                    stack.append((chain.from_iterable(node.items()), node))
+                elif node.__class__ is np.ndarray:
+                    if format.materialized:
+                        stack.append((iter(()), MaterializedArray(node, format=format)))
+                    else: # non-object arrays report included elements
+                        children: tp.List[tp.Iterable[tp.Any]] = []
+                        if node.dtype.kind == DTYPE_OBJECT_KIND:
+                            children.append(cls._iter_iterable(node))
+                        if not format.local_only and node.base is not None:
+                            # include the base array for numpy slices / views only if that base has not been seen
+                            children.append((node.base,))
+                        stack.append((chain.from_iterable(children), node))
+                elif node.__class__ is MaterializedArray:
+                    stack.append((iter(()), node))
+                else:
+                    # arrays do not have slots
+                    stack.append((chain(cls._iter_iterable(node), cls._iter_slots(node)), node))
+
+            # advance to the next unvisited child, yielding components whose children are exhausted
+            while stack:
+                node = next(stack[-1][0], exhausted)
+                if node is not exhausted:
+                    break
+                yield stack.pop()[1]
+            else:
+                return
 
 
 def memory_total(
@@ -186,13 +237,16 @@ def memory_total(
     Returns the total size of the object and its references, including nested refrences
     '''
     seen = set() if seen is None else seen
+    components = MemoryMeasure.nested_sizable_elements(obj,
+            seen=seen,
+            format=format,
+            )
+    if not format.data_only:
+        return sum(map(getsizeof, components))
 
     def gen() -> tp.Iterator[int]:
-        for component in MemoryMeasure.nested_sizable_elements(obj,
-                seen=seen,
-                format=format,
-                ):
-            if format.data_only and component.__class__ is MaterializedArray:
+        for component in components:
+            if component.__class__ is MaterializedArray:
                 yield component.__sizeof__() # call directly to avoid gc ovehead addition
             else:
                 yield getsizeof(component)
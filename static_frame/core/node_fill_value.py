@@ -66,6 +66,27 @@ INTERFACE_FILL_VALUE = (
         )
 
 
+def _binary_operator_factory(
+        name: str,
+        ) -> tp.Callable[['InterfaceFillValue[tp.Any]', tp.Any], tp.Any]:
+    '''
+    Return a binary operator method for ``name``; the operator is resolved once, not on every call.
+    '''
+    operator = OPERATORS[name]
+
+    def func(self: 'InterfaceFillValue[tp.Any]', other: tp.Any) -> tp.Any:
+        return self._container._ufunc_binary_operator(
+                operator=operator,
+                other=other,
+                axis=self._axis,
+                fill_value=self._fill_value,
+                )
+
+    func.__name__ = name
+    func.__qualname__ = f'InterfaceFillValue.{name}'
+    return func
+
+
 class InterfaceFillValue(Interface[TVContainer_co]):
 
     __slots__ = (
@@ -110,12 +131,14 @@ class InterfaceFillValue(Interface[TVContainer_co]):
         from static_frame.core.container_util import key_from_container_key
 
         key = key_from_container_key(index, key, expand_iloc=True)
-        key_is_multiple = isinstance(key, KEY_MULTIPLE_TYPES)
 
         if key.__class__ is slice:
+            # a slice is always multiple; only slices are compared to NULL_SLICE, never arrays
+            key_is_multiple = True
             key_is_null_slice = key == NULL_SLICE
             key = index._extract_loc(key) #type: ignore
         else:
+            key_is_multiple = isinstance(key, KEY_MULTIPLE_TYPES)
             key_is_null_slice = False
 
         return key, key_is_multiple, key_is_null_slice
@@ -127,15 +150,22 @@ class InterfaceFillValue(Interface[TVContainer_co]):
         '''
         from static_frame.core.container_util import get_col_fill_value_factory
 
-        key, is_multiple, is_null_slice = self._extract_key_attrs(
-                key,
-                self._container._index,
-                )
         fill_value = self._fill_value
         container = self._container
 
+        if key.__class__ is slice:
+            # all labels selected by a slice are present: there is nothing to fill
+            if key == NULL_SLICE and container.STATIC: # mutable containers must return a new container
+                return container
+            return container.loc[key] #type: ignore
+
+        key, is_multiple, _ = self._extract_key_attrs(
+                key,
+                container._index,
+                )
+
         if is_multiple:
-            return container.reindex(key if not is_null_slice else None, #type: ignore
+            return container.reindex(key, #type: ignore
                     fill_value=fill_value,
                     )
         # if a single value, return it or the fill value
@@ -155,13 +185,23 @@ class InterfaceFillValue(Interface[TVContainer_co]):
         fill_value = self._fill_value
         container = self._container # always a Frame
 
+        if row_key.__class__ is slice and column_key.__class__ is slice:
+            # all labels selected by slices are present: there is nothing to fill
+            if (row_key == NULL_SLICE and column_key == NULL_SLICE
+                    and container.STATIC): # mutable containers must return a new container
+                return container
+            return container.loc[row_key, column_key] # type: ignore
+
+        index = container._index
+        columns: IndexBase = container._columns #type: ignore
+
         row_key, row_is_multiple, row_is_null_slice = self._extract_key_attrs(
                 row_key,
-                container._index,
+                index,
                 )
         column_key, column_is_multiple, column_is_null_slice = self._extract_key_attrs(
                 column_key,
-                container._columns, #type: ignore
+                columns,
                 )
 
         if row_is_multiple and column_is_multiple:
@@ -179,7 +219,7 @@ class InterfaceFillValue(Interface[TVContainer_co]):
                 return fv #type: ignore
         elif not row_is_multiple:
             # row is an element, return Series indexed by columns
-            if row_key in container._index: #type: ignore
+            if row_key in index: #type: ignore
                 s = container.loc[row_key]
                 return s.reindex(column_key, fill_value=fill_value) #type: ignore
 
@@ -189,7 +229,7 @@ class InterfaceFillValue(Interface[TVContainer_co]):
                     name=row_key, # type: ignore
                     )
         # columns is an element, return Series indexed by index
-        if column_key in container._columns: #type: ignore
+        if column_key in columns: #type: ignore
             s = container[column_key]
             return s.reindex(row_key, fill_value=fill_value) #type: ignore
 
@@ -224,206 +264,33 @@ class InterfaceFillValue(Interface[TVContainer_co]):
         return self._extract_loc2d(NULL_SLICE, key)
 
     #---------------------------------------------------------------------------
-    def __add__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__add__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __sub__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__sub__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __mul__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__mul__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    # def __matmul__(self, other: tp.Any) -> tp.Any:
-    #     return self._container._ufunc_binary_operator(
-    #             operator=OPERATORS['__matmul__'],
-    #             other=other,
-    #             axis=self._axis,
-    #             fill_value=self._fill_value,
-    #             )
-
-    def __truediv__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__truediv__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __floordiv__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__floordiv__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __mod__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__mod__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __pow__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__pow__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __lshift__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__lshift__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __rshift__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__rshift__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __and__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__and__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __xor__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__xor__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __or__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__or__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __lt__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__lt__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __le__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__le__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __eq__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__eq__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __ne__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__ne__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __gt__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__gt__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __ge__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__ge__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
+    __add__ = _binary_operator_factory('__add__')
+    __sub__ = _binary_operator_factory('__sub__')
+    __mul__ = _binary_operator_factory('__mul__')
+    # __matmul__ = _binary_operator_factory('__matmul__')
+    __truediv__ = _binary_operator_factory('__truediv__')
+    __floordiv__ = _binary_operator_factory('__floordiv__')
+    __mod__ = _binary_operator_factory('__mod__')
+    __pow__ = _binary_operator_factory('__pow__')
+    __lshift__ = _binary_operator_factory('__lshift__')
+    __rshift__ = _binary_operator_factory('__rshift__')
+    __and__ = _binary_operator_factory('__and__')
+    __xor__ = _binary_operator_factory('__xor__')
+    __or__ = _binary_operator_factory('__or__')
+    __lt__ = _binary_operator_factory('__lt__')
+    __le__ = _binary_operator_factory('__le__')
+    __eq__ = _binary_operator_factory('__eq__')
+    __ne__ = _binary_operator_factory('__ne__')
+    __gt__ = _binary_operator_factory('__gt__')
+    __ge__ = _binary_operator_factory('__ge__')
 
     #---------------------------------------------------------------------------
-    def __radd__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__radd__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __rsub__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__rsub__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __rmul__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__rmul__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    # def __rmatmul__(self, other: tp.Any) -> tp.Any:
-    #     return self._container._ufunc_binary_operator(
-    #             operator=OPERATORS['__rmatmul__'],
-    #             other=other,
-    #             axis=self._axis,
-    #             fill_value=self._fill_value,
-    #             )
-
-    def __rtruediv__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__rtruediv__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
-
-    def __rfloordiv__(self, other: tp.Any) -> tp.Any:
-        return self._container._ufunc_binary_operator(
-                operator=OPERATORS['__rfloordiv__'],
-                other=other,
-                axis=self._axis,
-                fill_value=self._fill_value,
-                )
+    __radd__ = _binary_operator_factory('__radd__')
+    __rsub__ = _binary_operator_factory('__rsub__')
+    __rmul__ = _binary_operator_factory('__rmul__')
+    # __rmatmul__ = _binary_operator_factory('__rmatmul__')
+    __rtruediv__ = _binary_operator_factory('__rtruediv__')
+    __rfloordiv__ = _binary_operator_factory('__rfloordiv__')
 
 #---------------------------------------------------------------------------
 class InterfaceFillValueGO(InterfaceFillValue[TVContainer_co]): # only type is FrameGO
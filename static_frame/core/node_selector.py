@@ -7,6 +7,9 @@ from numpy.ma import MaskedArray
 
 from static_frame.core.assign import Assign
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import TBlocKey
@@ -21,6 +24,7 @@ from static_frame.core.util import TLabel
 from static_frame.core.util import TLocSelector
 from static_frame.core.util import TLocSelectorCompound
 from static_frame.core.util import TLocSelectorMany
+from static_frame.core.util import iterable_to_array_1d
 
 # from static_frame.core.util import AnyCallable
 
@@ -405,11 +409,10 @@ class InterfaceAssignTrio(InterfaceSelectTrio[TVContainer_co]):
             func_getitem: TLocSelectorFunc,
             delegate: tp.Type[Assign]
             ) -> None:
-        InterfaceSelectTrio.__init__(self,
-                func_iloc=func_iloc,
-                func_loc=func_loc,
-                func_getitem=func_getitem,
-                )
+        # NOTE: assign slots directly rather than calling InterfaceSelectTrio.__init__
+        self._func_iloc = func_iloc
+        self._func_loc = func_loc
+        self._func_getitem = func_getitem
         self.delegate = delegate #pylint: disable=E0237
 
 
@@ -425,12 +428,11 @@ class InterfaceAssignQuartet(InterfaceSelectQuartet[TVContainer_co]):
             func_bloc: tp.Any, # not sure what is the right type
             delegate: tp.Type[Assign]
             ) -> None:
-        InterfaceSelectQuartet.__init__(self,
-                func_iloc=func_iloc,
-                func_loc=func_loc,
-                func_getitem=func_getitem,
-                func_bloc=func_bloc,
-                )
+        # NOTE: assign slots directly rather than calling InterfaceSelectQuartet.__init__
+        self._func_iloc = func_iloc
+        self._func_loc = func_loc
+        self._func_getitem = func_getitem
+        self._func_bloc = func_bloc
         self.delegate = delegate #pylint: disable=E0237
 
 
@@ -616,33 +618,49 @@ class InterfaceConsolidate(Interface[TVContainer_co]):
         flag_attrs: tp.Tuple[str, ...] = ('owndata', 'f_contiguous', 'c_contiguous')
         columns: IndexBase = self._container.columns # type: ignore
 
-        def gen() -> tp.Tuple[DtypeAny, tp.Tuple[int, ...], int]:
-            iloc_start = 0
-
-            for b in self._container._blocks._blocks: # type: ignore
-                width = 1 if b.ndim == 1 else b.shape[1]
-
-                iloc_end = iloc_start + width
-                if iloc_end >= len(columns):
-                    iloc_slice = slice(iloc_start, None)
-                else:
-                    iloc_slice = slice(iloc_start, iloc_end)
-
-                sub = columns[iloc_slice] # returns a column
-                iloc: tp.Union[int, slice]
-                if len(sub) == 1:
-                    loc = sub[0]
-                    iloc = iloc_start
-                else: # get inclusive slice
-                    loc = slice(sub[0], sub[-1])
-                    iloc = iloc_slice
-
-                yield [loc, iloc, b.dtype, b.shape, b.ndim] + [
-                    getattr(b.flags, attr) for attr in flag_attrs]
-
-                iloc_start = iloc_end
-
-        return Frame.from_records(gen(),
+        blocks: tp.List[NDArrayAny] = self._container._blocks._blocks # type: ignore
+        count = len(columns)
+        # derive the column cut points of all blocks from the cumulative sum of block widths
+        ends = np.cumsum([1 if b.ndim == 1 else b.shape[1] for b in blocks])
+        starts = [0, *ends[:-1].tolist()]
+
+        # build each column as a typed array rather than inferring types from records
+        size = len(blocks)
+        locs: tp.List[tp.Any] = []
+        ilocs: tp.List[tp.Any] = []
+        dtypes = np.empty(size, dtype=DTYPE_OBJECT)
+        shapes = np.empty(size, dtype=DTYPE_OBJECT)
+
+        for i, (b, iloc_start, iloc_end) in enumerate(zip(blocks, starts, ends.tolist())):
+            if iloc_end >= count:
+                iloc_slice = slice(iloc_start, None)
+            else:
+                iloc_slice = slice(iloc_start, iloc_end)
+
+            sub = columns[iloc_slice] # returns a column
+            if len(sub) == 1:
+                locs.append(sub[0])
+                ilocs.append(iloc_start)
+            else: # get inclusive slice
+                locs.append(slice(sub[0], sub[-1]))
+                ilocs.append(iloc_slice)
+            dtypes[i] = b.dtype
+            shapes[i] = b.shape
+
+        # NOTE: labels and positions can be of any type; resolve their dtype as if from records
+        fields = [iterable_to_array_1d(locs)[0], iterable_to_array_1d(ilocs)[0], dtypes, shapes,
+                np.fromiter((b.ndim for b in blocks), dtype=DTYPE_INT_DEFAULT, count=size),
+                ]
+        for attr in flag_attrs:
+            fields.append(np.fromiter(
+                    (getattr(b.flags, attr) for b in blocks),
+                    dtype=DTYPE_BOOL,
+                    count=size,
+                    ))
+        for array in fields:
+            array.flags.writeable = False
+
+        return Frame.from_fields(fields,
             columns=('loc', 'iloc', 'dtype', 'shape', 'ndim') + flag_attrs
             )
 
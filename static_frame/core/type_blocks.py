@@ -35,6 +35,7 @@ from static_frame.core.style_config import StyleConfig
 from static_frame.core.util import DEFAULT_FAST_SORT_KIND
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_ISIN_ELEMENTWISE_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import EMPTY_ARRAY_OBJECT
@@ -54,6 +55,7 @@ from static_frame.core.util import TILocSelectorOne
 from static_frame.core.util import TSortKinds
 from static_frame.core.util import TupleConstructorType
 from static_frame.core.util import UFunc
+from static_frame.core.util import WarningsSilent
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_signature
@@ -68,6 +70,8 @@ from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import full_for_fill
 from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isin_array
+from static_frame.core.util import isin_kinds_comparable
+from static_frame.core.util import isin_partition_by_kind
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_nd
@@ -3235,14 +3239,42 @@ class TypeBlocks(ContainerOperand):
 
         other, other_is_unique = iterable_to_array_1d(other)
 
+        # if other is object, partition it into typed arrays such that non-object blocks can be evaluated without element-wise Python comparisons
+        other_by_kind = None
+        if other.dtype == DTYPE_OBJECT and any(
+                b.dtype.kind not in DTYPE_ISIN_ELEMENTWISE_KINDS for b in self._blocks):
+            other_by_kind = isin_partition_by_kind(other)
+
         def blocks() -> tp.Iterator[NDArrayAny]:
             for b in self._blocks:
-                # yields immutable arrays
-                yield isin_array(array=b,
-                        array_is_unique=False, # expensive to determine
-                        other=other,
-                        other_is_unique=other_is_unique,
-                        )
+                kind = b.dtype.kind
+                # NOTE: numpy compares across kinds (e.g. int64 and float64, int64 and uint64) by casting, which can lose precision; only compare typed partitions of the same kind, and use element-wise Python comparison otherwise
+                if (other_by_kind is None
+                        or kind in DTYPE_ISIN_ELEMENTWISE_KINDS
+                        or any(k != kind and isin_kinds_comparable(kind, k)
+                        for k in other_by_kind)):
+                    # yields immutable arrays
+                    yield isin_array(array=b,
+                            array_is_unique=False, # expensive to determine
+                            other=other,
+                            other_is_unique=other_is_unique,
+                            )
+                elif kind in other_by_kind:
+                    part = other_by_kind[kind]
+                    if part.dtype != b.dtype:
+                        # NOTE: numpy may cast values to the block's dtype (e.g. float64 to float32) before comparing; only values that survive a round trip through the block's dtype can equal an element, and these compare exactly in that dtype
+                        with WarningsSilent():
+                            part_cast = part.astype(b.dtype)
+                            part = part_cast[part_cast.astype(part.dtype) == part]
+                    yield isin_array(array=b,
+                            array_is_unique=False,
+                            other=part,
+                            other_is_unique=other_is_unique,
+                            )
+                else: # no values in other can match this block
+                    post = np.full(b.shape, False, dtype=DTYPE_BOOL)
+                    post.flags.writeable = False
+                    yield post
 
         return self.from_blocks(blocks())
 
@@ -3250,6 +3282,10 @@ class TypeBlocks(ContainerOperand):
     def transpose(self) -> 'TypeBlocks':
         '''Return a new TypeBlocks that transposes and concatenates all blocks.
         '''
+        if len(self._blocks) == 1:
+            # NOTE: transposing an immutable array returns an immutable view; no copy is necessary
+            return self.from_blocks(column_2d_filter(self._blocks[0]).transpose())
+
         dtype = self._index.dtype
         blocks = []
         for b in self._blocks:
@@ -72,6 +72,7 @@ TSortKinds = tp.Literal['quicksort', 'mergesort']
 DEFAULT_SORT_KIND: tp.Literal['mergesort'] = 'mergesort'
 DEFAULT_STABLE_SORT_KIND: tp.Literal['mergesort'] = 'mergesort' # for when results will be in correct if not used
 DEFAULT_FAST_SORT_KIND: tp.Literal['quicksort'] = 'quicksort' # for when fastest is all that we want
+DEFAULT_WRITE_BUFFER_SIZE = 1 << 18 # for bulk text writes to files opened from a path
 
 DTYPE_DATETIME_KIND = 'M'
 DTYPE_TIMEDELTA_KIND = 'm'
@@ -102,6 +103,13 @@ DTYPE_NAN_NAT_KINDS = frozenset((
         DTYPE_TIMEDELTA_KIND,
         ))
 
+# kinds that isin evaluates against an object array with element-wise Python comparison
+DTYPE_ISIN_ELEMENTWISE_KINDS = frozenset((
+        DTYPE_OBJECT_KIND,
+        DTYPE_DATETIME_KIND,
+        DTYPE_TIMEDELTA_KIND,
+        ))
+
 # this is all kinds except 'V'
 # DTYPE_FALSY_KINDS = frozenset((
 #         DTYPE_FLOAT_KIND,
@@ -1222,6 +1230,43 @@ def argsort_array(array: NDArrayAny, kind: TSortKinds = DEFAULT_STABLE_SORT_KIND
 
     return array.argsort(kind=kind)
 
+def argsort_head(
+        array: NDArrayAny,
+        count: int,
+        *,
+        ascending: bool = True,
+        kind: TSortKinds = DEFAULT_SORT_KIND,
+        ) -> NDArrayAny:
+    '''
+    Return the first ``count`` positions of the sort order of a 1D array, where a descending order is the reverse of the ascending order. For a stable ``kind``, this is equivalent to ``np.argsort(array, kind=kind)[:count]`` (or ``np.argsort(array, kind=kind)[::-1][:count]``), but uses a linear-time partition to avoid a full sort when ``count`` is smaller than the array.
+    '''
+    size = len(array)
+    if count < 0 or count >= size or array.dtype.kind == DTYPE_OBJECT_KIND:
+        order = np.argsort(array, kind=kind)
+        return (order if ascending else order[::-1])[:count]
+    if count == 0:
+        return EMPTY_ARRAY_INT
+
+    # the boundary value: the last value included in the head
+    pos = count - 1 if ascending else size - count
+    boundary = np.partition(array, pos)[pos]
+    if boundary != boundary: # NaN or NaT; NaNs sort last and do not compare equal
+        order = np.argsort(array, kind=kind)
+        return (order if ascending else order[::-1])[:count]
+
+    # NOTE: NaN compares False; when descending, NaNs sort first and must be included
+    exceed = (array < boundary) if ascending else ~(array <= boundary)
+    exceed_pos = np.nonzero(exceed)[0]
+    equal_pos = np.nonzero(array == boundary)[0]
+    # of values equal to the boundary, a stable ascending sort places the lowest positions first
+    needed = count - len(exceed_pos)
+    equal_pos = equal_pos[:needed] if ascending else equal_pos[len(equal_pos) - needed:]
+
+    # sort the selected positions such that a stable sort retains position order for ties
+    selected = np.sort(np.concatenate((exceed_pos, equal_pos)))
+    order = selected[np.argsort(array[selected], kind=kind)]
+    return order if ascending else order[::-1]
+
 def ufunc_unique1d(array: NDArrayAny) -> NDArrayAny:
     '''
     Find the unique elements of an array, ignoring shape. Optimized from NumPy implementation based on assumption of 1D array.
@@ -1554,25 +1599,25 @@ def _argminmax_2d(
         axis: int = 0
         ) -> NDArrayAny: # int or float array
     '''
-    Perform argmin or argmax, handling NaN as needed.
+    Perform argmin or argmax, handling NaN as needed. Always returns an immutable array.
     '''
     # always need to to check for nans, even if skipna is False, as np will raise if all NaN, and will not return Nan if there skipna is false
     isna = isna_array(array)
 
     isna_axis = isna.any(axis=axis)
-    if isna_axis.all(): # nan in every axis remaining position
-        if not skipna:
-            return np.full(isna_axis.shape, np.nan, dtype=DTYPE_FLOAT_DEFAULT)
-
-    if isna_axis.any():
+    if isna_axis.all() and not skipna: # nan in every axis remaining position
+        post = np.full(isna_axis.shape, np.nan, dtype=DTYPE_FLOAT_DEFAULT)
+    elif isna_axis.any():
         # always use skipna ufunc if any NaNs are present, as otherwise the wrong indices are returned when a nan is encountered (rather than a nan)
         post = ufunc_skipna(array, axis=axis)
         if not skipna:
-            post = post.astype(DTYPE_FLOAT_DEFAULT  )
+            post = post.astype(DTYPE_FLOAT_DEFAULT)
             post[isna_axis] = np.nan
-        return post
+    else:
+        post = ufunc(array, axis=axis)
 
-    return ufunc(array, axis=axis)
+    post.flags.writeable = False
+    return post
 
 argmin_2d = partial(_argminmax_2d, ufunc=np.argmin, ufunc_skipna=np.nanargmin)
 argmax_2d = partial(_argminmax_2d, ufunc=np.argmax, ufunc_skipna=np.nanargmax)
@@ -2406,9 +2451,10 @@ def _array_to_duplicated_sortable(
             # all non-first, non-last duplicates is the intersection.
             dupes = f_flags & l_flags
 
-    # undo the sort: get the indices to extract Booleans from dupes; in some cases r_idx is the same as o_idx, but not all
-    r_idx = np.argsort(o_idx, axis=None, kind=DEFAULT_STABLE_SORT_KIND)
-    return dupes[r_idx]
+    # undo the sort: as o_idx is a permutation, scattering dupes into o_idx positions is equivalent to, but cheaper than, extracting with the argsort of o_idx
+    post: NDArrayAny = np.empty(len(dupes), dtype=DTYPE_BOOL)
+    post[o_idx] = dupes
+    return post
 
 def array_to_duplicated(
         array: NDArrayAny,
@@ -2992,6 +3038,36 @@ def isin_array(*,
     result.flags.writeable = False
     return result
 
+def isin_partition_by_kind(
+        other: NDArrayAny,
+        ) -> tp.Optional[tp.Dict[str, NDArrayAny]]:
+    '''
+    Given a 1D object array, partition its elements into immutable, non-object arrays keyed by dtype kind. This permits evaluating `isin` on non-object arrays without falling back to element-wise Python comparisons. Returns None if any element can only be represented with an object dtype, or is a datetime64 or timedelta64, as the unit-dependent equality of those elements is not reproduced by typed comparison.
+    '''
+    parts: tp.DefaultDict[str, tp.List[tp.Any]] = defaultdict(list)
+    for v in other:
+        dtype = dtype_from_element(v)
+        if dtype == DTYPE_OBJECT or dtype.kind in DTYPE_NAT_KINDS:
+            return None
+        parts[dtype.kind].append(v)
+
+    post = {}
+    for kind, values in parts.items():
+        array = np.array(values)
+        if array.dtype == DTYPE_OBJECT: # mixed types or units that cannot be resolved
+            return None
+        array.flags.writeable = False
+        post[kind] = array
+    return post
+
+def isin_kinds_comparable(kind_a: str, kind_b: str) -> bool:
+    '''
+    Return True if elements of the two dtype kinds can compare as equal.
+    '''
+    if kind_a == kind_b:
+        return True
+    return kind_a in DTYPE_NUMERICABLE_KINDS and kind_b in DTYPE_NUMERICABLE_KINDS
+
 def isin(
         array: NDArrayAny,
         other: tp.Iterable[tp.Any],
@@ -3310,7 +3386,8 @@ class PositionsAllocator:
             return UNIT_ARRAY_INT
 
         if size > cls._size:
-            cls._size = size * 2
+            # grow to the next power of two so that growth is geometric and bounded by twice the request
+            cls._size = 1 << (int(size) - 1).bit_length() # size may be a NumPy integer
             cls._array = np.arange(cls._size, dtype=DTYPE_INT_DEFAULT)
             cls._array.flags.writeable = False
         # slices of immutable arrays are immutable
@@ -3628,24 +3705,21 @@ def file_like_manager(
         file_like: PathSpecifierOrFileLikeOrIterator,
         encoding: tp.Optional[str] = None,
         mode: str = 'r',
+        buffering: int = -1,
         ) -> tp.Iterator[tp.Iterator[str]]:
     '''
     Return an file or file-like object. Manage closing of file if necessary.
+
+    Args:
+        buffering: buffer size passed to ``open`` when ``file_like`` is a path; ignored for open file-like objects.
     '''
     file_like = path_filter(file_like)
 
-    is_file = False
-    try:
-        if isinstance(file_like, str):
-            f = open(file_like, mode=mode, encoding=encoding)
-            is_file = True
-        else:
-            f = file_like # assume an open file-like object
-        yield f
-
-    finally:
-        if is_file:
-            f.close()
+    if isinstance(file_like, str):
+        with open(file_like, mode=mode, encoding=encoding, buffering=buffering) as f:
+            yield f
+    else:
+        yield file_like # assume an open file-like object; the caller is responsible for closing
 
 #-------------------------------------------------------------------------------
 # trivial, non NP util
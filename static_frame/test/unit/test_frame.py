@@ -897,6 +897,15 @@ class TestUnit(TestCase):
         self.assertEqual(df.values.tolist(), [[1, 1]])
         self.assertEqual(df.index.values.tolist(), [(1, 'dd', 0)])
 
+    def test_frame_to_pandas_b2(self) -> None:
+        f1 = sf.Frame(np.arange(6).reshape(3, 2), columns=('a', 'b'))
+        df = f1.to_pandas()
+        self.assertFalse(np.shares_memory(df.values, f1.values))
+
+        df.iloc[0, 0] = 100
+        self.assertEqual(df.values.tolist(), [[100, 1], [2, 3], [4, 5]])
+        self.assertEqual(f1.values.tolist(), [[0, 1], [2, 3], [4, 5]])
+
     def test_frame_to_pandas_c(self) -> None:
         f = sf.FrameGO.from_elements(['a' for x in range(5)], columns=['a'])
         f['b'] = [1.0 for i in range(5)]
@@ -1592,6 +1601,51 @@ class TestUnit(TestCase):
         self.assertEqual(ds2[3].values.tolist(),
                 [False, True, False, True])
 
+    def test_frame_to_xarray_b(self) -> None:
+        index = IndexHierarchy.from_labels(
+                (('b', '2021-01-02'), ('a', '2021-01-01'), ('b', '2021-01-01')),
+                index_constructors=(Index, IndexDate),
+                name=('x', 'y'),
+                )
+        columns = IndexHierarchy.from_labels((('p', 1), ('q', 2)))
+        f1 = Frame.from_fields(((10, 20, 30), ('c', 'd', 'e')),
+                index=index,
+                columns=columns,
+                )
+        ds1 = f1.to_xarray()
+        self.assertEqual(ds1['x'].values.tolist(), ['a', 'b'])
+        self.assertEqual(ds1[('p', 1)].values.tolist()[1], [30.0, 10.0])
+        self.assertEqual(ds1[('p', 1)].values.tolist()[0][0], 20.0)
+        self.assertEqual(ds1[('q', 2)].values[1].tolist(), ['e', 'c'])
+
+    def test_frame_to_xarray_c(self) -> None:
+        columns = IndexHierarchy.from_labels((('p', 1),))
+        index1 = IndexHierarchy.from_labels(
+                ((1.0, 'a'), (np.nan, 'a'), (2.5, 'b'), (np.nan, 'b'), (np.nan, 'c')),
+                name=('x', 'y'),
+                )
+        f1 = Frame.from_fields(((1, 2, 3, 4, 5),), index=index1, columns=columns)
+        ds1 = f1.to_xarray()
+        # NaN labels are merged into a single coordinate
+        self.assertEqual(ds1['x'].values[:2].tolist(), [1.0, 2.5])
+        self.assertTrue(np.isnan(ds1['x'].values[2]))
+        self.assertEqual(len(ds1['x']), 3)
+        post1 = ds1[('p', 1)].values
+        self.assertEqual(post1[2].tolist(), [2.0, 4.0, 5.0])
+        self.assertEqual(np.isnan(post1[:2]).sum(), 4)
+
+        index2 = IndexHierarchy.from_labels(
+                ((np.datetime64('2021-01-01'), 'a'),
+                (np.datetime64('NaT', 'D'), 'a'),
+                (np.datetime64('NaT', 'D'), 'b')),
+                index_constructors=(IndexDate, Index),
+                name=('x', 'y'),
+                )
+        f2 = Frame.from_fields(((1, 2, 3),), index=index2, columns=columns)
+        ds2 = f2.to_xarray()
+        self.assertEqual(len(ds2['x']), 2)
+        self.assertEqual(ds2[('p', 1)].values[1].tolist(), [2.0, 3.0])
+
     #---------------------------------------------------------------------------
 
     def test_frame_to_series_a(self) -> None:
@@ -1965,6 +2019,16 @@ class TestUnit(TestCase):
         with self.assertRaises(RuntimeError):
             f[('s', 'b')] = f
 
+    def test_frame_setitem_n2(self) -> None:
+        f = sf.FrameGO(index=('c', 'b', 'a'))
+        s1 = Series((1, 2, 3), index=f.index)
+        f['x'] = s1
+        f['y'] = s1.values
+        with self.assertRaises(RuntimeError):
+            f['y'] = s1
+        self.assertEqual(f.to_pairs(),
+                (('x', (('c', 1), ('b', 2), ('a', 3))), ('y', (('c', 1), ('b', 2), ('a', 3)))))
+
     def test_frame_setitem_o(self) -> None:
         import pandas as pd
 
@@ -2006,6 +2070,22 @@ class TestUnit(TestCase):
                 [30, 50, 'b', True, False, -1, 5]],
                 match_dtype=object)
 
+    def test_frame_extend_items_b(self) -> None:
+        f1 = FrameGO(index=('x', 'y', 'z'))
+        s1 = Series((1, 2, 3), index=('x', 'y', 'z'))
+        s2 = Series((4, 5), index=('z', 'x'))
+
+        f1.extend_items((('a', s1), ('b', s1 * 2), ('c', s2), ('d', s1)), fill_value=0)
+        self.assertEqual(f1.to_pairs(),
+                (('a', (('x', 1), ('y', 2), ('z', 3))),
+                ('b', (('x', 2), ('y', 4), ('z', 6))),
+                ('c', (('x', 5), ('y', 0), ('z', 4))),
+                ('d', (('x', 1), ('y', 2), ('z', 3))))
+                )
+        with self.assertRaises(RuntimeError):
+            f1.extend_items((('e', s1), ('a', s1)))
+        self.assertEqual(f1.columns.values.tolist(), ['a', 'b', 'c', 'd', 'e'])
+
     def test_frame_extend_a(self) -> None:
         records = (
                 (1, 2, 'a', False, True),
@@ -3189,6 +3269,22 @@ class TestUnit(TestCase):
                 ((0, ((0, -88017), (1, ''))), (1, ((0, 162197), (1, 'b'))), (2, ((0, -3648), (1, 'a'))), (3, ((0, 129017), (1, ''))))
                 )
 
+    def test_frame_assign_loc_m(self) -> None:
+        f1 = Frame.from_element(0, index=('a', 'b', 'c'), columns=('x', 'y'))
+        # full selections reindex against the Frame's own indices
+        f2 = f1.assign['x'](Series((3, 1), index=('c', 'a')), fill_value=-1)
+        self.assertEqual(f2.to_pairs(),
+                (('x', (('a', 1), ('b', -1), ('c', 3))), ('y', (('a', 0), ('b', 0), ('c', 0))))
+                )
+        f3 = f1.assign[['y', 'x']](Frame.from_element(5, index=('b', 'a', 'c'), columns=('y', 'x')))
+        self.assertEqual(f3.to_pairs(),
+                (('x', (('a', 5), ('b', 5), ('c', 5))), ('y', (('a', 5), ('b', 5), ('c', 5))))
+                )
+        f4 = f1.assign[:](f1 + 1)
+        self.assertEqual(f4.to_pairs(),
+                (('x', (('a', 1), ('b', 1), ('c', 1))), ('y', (('a', 1), ('b', 1), ('c', 1))))
+                )
+
     #---------------------------------------------------------------------------
 
     def test_frame_assign_coercion_a(self) -> None:
@@ -4580,6 +4676,77 @@ class TestUnit(TestCase):
                 ((0, ((0, False), (1, False))), (1, ((0, False), (1, False))), (2, ((0, False), (1, False))))
                 )
 
+    def test_frame_isin_c(self) -> None:
+
+        f1 = Frame.from_fields((
+                ['a', 'b', 'c'],
+                [1, 30, 5],
+                [2.5, 1.0, 3.0],
+                [True, False, False],
+                [np.datetime64('2012'), np.datetime64('2020'), np.datetime64('2021')],
+                ['x', None, 30],
+                ))
+
+        post1 = f1.isin(('b', 30, 1, np.datetime64('2020')))
+        self.assertEqual(post1.values.tolist(),
+                [[False, True, False, True, False, False],
+                [True, True, True, False, True, False],
+                [False, False, False, False, False, True]]
+                )
+
+        # datetime64 values of a different unit do not match in an object lookup
+        post2 = f1.isin(('x', np.datetime64('2021-01-01')))
+        self.assertEqual(post2.values.tolist(),
+                [[False, False, False, False, False, True],
+                [False, False, False, False, False, False],
+                [False, False, False, False, False, False]]
+                )
+
+    def test_frame_isin_d(self) -> None:
+        # mixed object lookups match as element-wise Python comparison does
+        f1 = Frame.from_fields((
+                [1, 2, 60],
+                np.array(['2020-01-01', '2021-01-01', '2022-01-01'], dtype='datetime64[D]'),
+                [2**53 + 1, 3, 4],
+                ))
+
+        post1 = f1.isin(('a', 1, np.timedelta64(1, 's')))
+        self.assertEqual(post1.values.tolist(),
+                [[True, False, False], [False, False, False], [False, False, False]]
+                )
+        post2 = f1.isin(('a', np.timedelta64(2, 's'), np.timedelta64(1, 'm')))
+        self.assertEqual(post2.values.tolist(),
+                [[True, False, False], [True, False, False], [False, False, False]]
+                )
+        post3 = f1.isin(('a', np.datetime64('2020-01-01T00')))
+        self.assertEqual(post3.values.tolist(),
+                [[False, False, False], [False, False, False], [False, False, False]]
+                )
+        post4 = f1.isin(('a', 2.0**53, 3.0, 2**63))
+        self.assertEqual(post4.values.tolist(),
+                [[False, False, False], [False, False, True], [False, False, False]]
+                )
+
+    def test_frame_isin_e(self) -> None:
+        # float64 lookup values do not match the nearest float32 or float16 value
+        f1 = Frame.from_fields((
+                np.array([0.1, 0.5, 2.0], dtype=np.float32),
+                np.array([0.1, 0.5, 2.0], dtype=np.float16),
+                np.array([44, 1, 2], dtype=np.int8),
+                ))
+        post1 = f1.isin((0.1, 'a'))
+        self.assertEqual(post1.values.tolist(),
+                [[False, False, False], [False, False, False], [False, False, False]]
+                )
+        post2 = f1.isin((0.1, 0.5, 'a'))
+        self.assertEqual(post2.values.tolist(),
+                [[False, False, False], [True, True, False], [False, False, False]]
+                )
+        post3 = f1.isin((2.0, np.float32(0.1), 300, 'a'))
+        self.assertEqual(post3.values.tolist(),
+                [[True, False, False], [False, False, False], [True, True, True]]
+                )
+
     #---------------------------------------------------------------------------
 
     def test_frame_transpose_a(self) -> None:
@@ -5418,6 +5585,22 @@ class TestUnit(TestCase):
                 (('a', (('x', 3), ('y', 8), ('z', 2))), ('c', (('x', 3), ('y', 4), ('z', 6))), ('b', (('x', 7), ('y', 1), ('z', 9))))
                 )
 
+    def test_frame_sort_values_q(self) -> None:
+        f1 = ff.parse('s(20,3)|v(int,float,str)')
+
+        for ascending in (True, False):
+            for count in (0, 1, 5, 20, 30):
+                for label in (0, 1, 2, [0, 1]):
+                    f2 = f1.sort_values(label, ascending=ascending, count=count)
+                    f3 = f1.sort_values(label, ascending=ascending).head(count)
+                    self.assertTrue(f2.equals(f3, compare_dtype=True))
+
+        f4 = f1.sort_values(0, ascending=False, count=3)
+        self.assertEqual(f4.index.values.tolist(), [4, 11, 7])
+
+        f5 = f1.iloc[:, :2].sort_values(19, axis=0, count=1)
+        self.assertEqual(f5.columns.values.tolist(), [0])
+
     #---------------------------------------------------------------------------
 
     def test_frame_relabel_a(self) -> None:
@@ -7296,6 +7479,51 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
     @skip_win
+    def test_frame_to_str_records_b(self) -> None:
+        f1 = Frame.from_fields((
+                np.array([0.1, np.nan, np.inf]),
+                np.array([0.1, np.nan, 2], dtype=np.float32),
+                np.array(['2021-01', 'NaT', '1999-12'], dtype='datetime64[M]'),
+                np.array([b'a', b'b', b'c']),
+                ),
+                columns=('a', 'b', 'c', 'd'),
+                )
+        self.assertEqual(tuple(f1._to_str_records(include_index=False)),
+                (['a', 'b', 'c', 'd'],
+                ['0.1', '0.10000000149011612', '2021-01', "b'a'"],
+                ['', '', '', "b'b'"],
+                ['inf', '2.0', '1999-12', "b'c'"])
+                )
+        self.assertEqual(tuple(f1._to_str_records(include_index=False, store_filter=None)),
+                (['a', 'b', 'c', 'd'],
+                ['0.1', '0.10000000149011612', '2021-01', "b'a'"],
+                ['nan', 'nan', 'NaT', "b'b'"],
+                ['inf', '2.0', '1999-12', "b'c'"])
+                )
+
+    def test_frame_to_str_records_c(self) -> None:
+        f1 = Frame.from_fields((np.arange(10_000), np.arange(10_000) % 2 == 0),
+                index=IndexHierarchy.from_product(range(100), tuple(str(i) for i in range(100))),
+                )
+        post = list(f1._to_str_records(include_columns=False))
+        self.assertEqual(len(post), 10_000)
+        self.assertEqual(post[0], ['0', '0', '0', 'True'])
+        self.assertEqual(post[4097], ['40', '97', '4097', 'False'])
+        self.assertEqual(post[-1], ['99', '99', '9999', 'False'])
+
+    def test_frame_to_str_records_d(self) -> None:
+        a1 = np.array([0.1, np.nan, np.inf], dtype=np.float32)
+        f1 = Frame.from_fields((a1, a1.astype(np.complex64)), columns=('a', 'b'))
+
+        post1 = list(f1._to_str_records(include_columns=False))
+        self.assertEqual(post1,
+                [['0', '0.10000000149011612', '(0.10000000149011612+0j)'], ['1', '', ''], ['2', 'inf', '(inf+0j)']]
+                )
+        post2 = list(f1._to_str_records(include_columns=False, store_filter=None))
+        self.assertEqual(post2,
+                [['0', '0.10000000149011612', '(0.10000000149011612+0j)'], ['1', 'nan', '(nan+0j)'], ['2', 'inf', '(inf+0j)']]
+                )
+
     def test_frame_to_delimited_a(self) -> None:
 
         records = (
@@ -7561,6 +7789,29 @@ class TestUnit(TestCase):
                     (((10, 'I'), (('p', 10.0), ('q', 50.0))), ((10, 'II'), (('p', 20.0), ('q', 60.4))), ((20, 'I'), (('p', 50), ('q', -50))), ((20, 'II'), (('p', 60), ('q', -60))))
                     )
 
+    def test_frame_to_csv_f(self) -> None:
+        # output larger than the write buffer
+        f1 = ff.parse('s(20_000,4)|v(int,float,str,bool)')
+
+        with temp_file('.csv') as fp:
+            f1.to_csv(fp)
+            f2 = Frame.from_csv(fp, index_depth=1)
+            self.assertEqual(f2.shape, (20_000, 4))
+            self.assertTrue(f2.equals(f1, compare_dtype=False, compare_class=False))
+
+    def test_frame_to_csv_g(self) -> None:
+        # zero-column frames write only the header
+        f1 = Frame(index=(1, 2))
+        file = StringIO()
+        f1.to_csv(file)
+        file.seek(0)
+        self.assertEqual(file.read(), '__index0__\n')
+
+        file = StringIO()
+        f1.to_csv(file, include_index=False)
+        file.seek(0)
+        self.assertEqual(file.read(), '\n')
+
     #---------------------------------------------------------------------------
 
     def test_frame_to_tsv_a(self) -> None:
@@ -15504,5 +15755,21 @@ class TestUnit(TestCase):
                 (3, 5),
                 )
 
+    def test_frame_consolidate_g(self) -> None:
+        f1 = Frame.from_fields(
+                ((10, 20, 30), (2.5, 4.5, 5.5), ('p', 'q', 'r')),
+                columns=('a', 'b', 'c'),
+                )
+        post1 = f1.consolidate.status
+        self.assertEqual(post1.dtypes.values.tolist(),
+                [np.dtype('<U1'), np.dtype(np.int64), np.dtype(object), np.dtype(object), np.dtype(np.int64), np.dtype(bool), np.dtype(bool), np.dtype(bool)]
+                )
+
+        f2 = Frame(np.arange(6).reshape(3, 2), columns=('a', 'b'))
+        post2 = f2.consolidate.status
+        self.assertEqual(post2.dtypes.values.tolist(),
+                [np.dtype(object), np.dtype(object), np.dtype(object), np.dtype(object), np.dtype(np.int64), np.dtype(bool), np.dtype(bool), np.dtype(bool)]
+                )
+
 if __name__ == '__main__':
     unittest.main()
@@ -506,6 +506,22 @@ class TestUnit(TestCase):
                 )
         self.assertEqual(post.index.name, 's')
 
+    def test_frame_iter_group_a2(self) -> None:
+        f1 = FrameGO.from_records((('A', 1), ('B', 2), ('A', 3)), columns=('p', 'q'))
+
+        for label, f2 in f1.iter_group_items('p'):
+            self.assertIs(f2.__class__, FrameGO)
+            f2['x'] = label
+        self.assertEqual(f1.columns.values.tolist(), ['p', 'q'])
+
+        f3 = f1.T.to_frame_go()
+        post = dict(f3.iter_group_items('p', axis=1))
+        self.assertEqual(post['A'].columns.values.tolist(), [0, 2])
+        self.assertEqual(post['A'].index.values.tolist(), ['p', 'q'])
+        post['A']['x'] = None
+        self.assertEqual(f3.columns.values.tolist(), [0, 1, 2])
+        self.assertEqual(post['B'].to_pairs(), ((1, (('p', 'B'), ('q', 2))),))
+
     def test_frame_iter_group_b(self) -> None:
         columns = tuple('pqrst')
         index = tuple('zxwy')
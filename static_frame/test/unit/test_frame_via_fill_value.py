@@ -148,6 +148,45 @@ class TestUnit(TestCase):
                 (('d', -1), ('e', -1))
                 )
 
+    def test_frame_via_fill_value_loc_i(self) -> None:
+
+        f1 = Frame(np.arange(12).reshape(4, 3), index=tuple('abcd'), columns=tuple('xyz'))
+        self.assertIs(f1.via_fill_value(-1).loc[:, :], f1)
+        self.assertIs(f1.via_fill_value(-1)[:], f1)
+
+        s1 = f1['x']
+        self.assertIs(s1.via_fill_value(-1)[:], s1)
+        self.assertIs(s1.via_fill_value(-1).loc[:], s1)
+
+
+    def test_frame_via_fill_value_loc_j(self) -> None:
+
+        f1 = Frame(np.arange(12).reshape(4, 3), index=tuple('abcd'), columns=tuple('xyz'), name='f')
+        f2 = f1.via_fill_value(-1).loc['b':'c', 'y':]
+        self.assertEqual(f2.to_pairs(),
+                (('y', (('b', 4), ('c', 7))), ('z', (('b', 5), ('c', 8))))
+                )
+        self.assertEqual(f2.name, 'f')
+
+        s1 = f1.via_fill_value(-1)['y':]['z']
+        self.assertEqual(s1.via_fill_value(-1)['c':].to_pairs(),
+                (('c', 8), ('d', 11))
+                )
+
+    def test_frame_via_fill_value_loc_k(self) -> None:
+
+        f1 = FrameGO(np.arange(12).reshape(4, 3), index=tuple('abcd'), columns=tuple('xyz'))
+        f2 = f1.via_fill_value(0).loc[:, :]
+        self.assertIsNot(f2, f1)
+        f2['w'] = 0
+        self.assertEqual(f1.columns.values.tolist(), ['x', 'y', 'z'])
+
+        f3 = f1.via_fill_value(0)[:]
+        self.assertIsNot(f3, f1)
+        f3['w'] = 0
+        self.assertEqual(f1.columns.values.tolist(), ['x', 'y', 'z'])
+
+
 
 if __name__ == '__main__':
     import unittest
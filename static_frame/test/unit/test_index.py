@@ -65,6 +65,31 @@ class TestUnit(TestCase):
         self.assertTrue(mloc(a1) == mloc(a2))
         self.assertTrue(mloc(a3) == mloc(a2))
 
+    def test_positions_allocator_b(self) -> None:
+
+        a1 = PositionsAllocator.get(3000)
+        self.assertEqual(len(a1), 3000)
+        self.assertEqual(a1[-1], 2999)
+        self.assertFalse(a1.flags.writeable)
+        # the shared array is grown to a power of two
+        size = len(a1.base)
+        self.assertTrue(size >= 3000)
+        self.assertEqual(size & (size - 1), 0)
+
+        a2 = PositionsAllocator.get(4000)
+        self.assertTrue(mloc(a1) == mloc(a2))
+
+    def test_positions_allocator_c(self) -> None:
+        # request more than the shared array holds to force growth
+        count = np.int64(len(PositionsAllocator.get(2).base) + 1)
+        a1 = PositionsAllocator.get(count)
+        self.assertEqual(len(a1), count)
+        self.assertEqual(a1[-1], count - 1)
+        self.assertEqual(len(a1.base), 2 * (count - 1))
+
+        s = Series(range(5000), index=IndexAutoFactory(np.int64(5000)))
+        self.assertEqual(s.index.values[-1], 4999)
+
     def test_index_slotted_a(self) -> None:
         idx1 = Index(('a', 'b', 'c', 'd'), name='foo')
 
@@ -659,6 +684,19 @@ class TestUnit(TestCase):
         post = idx1._loc_to_iloc(np.array([True, False, True, False]))
         self.assertEqual(post.tolist(), [True, False, True, False]) #type: ignore
 
+    def test_index_go_g(self) -> None:
+
+        idx1 = IndexAutoFactory.from_optional_constructor(3,
+                default_constructor=IndexGO)
+        idx1.append(3) # type: ignore
+        self.assertTrue(idx1._recache)
+        self.assertTrue(3 in idx1)
+        self.assertFalse(4 in idx1)
+        self.assertFalse(-1 in idx1)
+        self.assertFalse('a' in idx1)
+        # membership does not require updating the array cache
+        self.assertTrue(idx1._recache)
+
     #---------------------------------------------------------------------------
 
     def test_index_sort_a(self) -> None:
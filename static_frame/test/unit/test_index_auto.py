@@ -25,6 +25,18 @@ class TestUnit(TestCase):
         self.assertEqual(len(idx1), 4)
         self.assertEqual(idx1.STATIC, True)
 
+    def test_index_auto_factory_a2(self) -> None:
+
+        for size in (0, 1, 3):
+            idx1 = IndexAutoFactory.from_optional_constructor(size,
+                    default_constructor=Index)
+            idx2 = Index(np.arange(size), loc_is_iloc=True)
+            self.assertIs(idx1.__class__, Index)
+            self.assertTrue(idx1.equals(idx2, compare_dtype=True, compare_name=True))
+            self.assertEqual(idx1.name, None)
+            self.assertFalse(idx1.values.flags.writeable)
+            self.assertEqual(idx1.loc[size - 1:].values.tolist(), idx2.loc[size - 1:].values.tolist())
+
     def test_index_auto_factory_b(self) -> None:
 
         idx1 = IndexAutoFactory.from_optional_constructor(8,
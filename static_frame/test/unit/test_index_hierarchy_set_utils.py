@@ -3,7 +3,11 @@ from __future__ import annotations
 import unittest
 from string import ascii_letters
 
+import numpy as np
+
+from static_frame.core.index import Index
 from static_frame.core.index_base import IndexBase
+from static_frame.core.index_datetime import IndexDate
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.index_hierarchy_set_utils import index_hierarchy_difference
 from static_frame.core.index_hierarchy_set_utils import index_hierarchy_intersection
@@ -61,6 +65,54 @@ class TestUnit(TestCase):
 
         self.assertTrue(actual.equals(expected), msg=(expected.rename("expected"), actual.rename("actual")))
 
+    def test_index_hierarchy_intersection_reference(self) -> None:
+        ih1 = IndexHierarchy.from_product(('a', 'b', 'c', 'd'), range(10))
+        ih2 = IndexHierarchy.from_labels((('b', 3), ('x', 3), ('d', 20), ('d', 9), ('a', 0)))
+        ih3 = IndexHierarchy.from_product(('a', 'b', 'd'), range(5, -5, -1))
+
+        post = index_hierarchy_intersection(ih1, ih2, ih3)
+        self.assertEqual(set(post), {('b', 3), ('a', 0)})
+        self.assertEqual(post.index_at_depth(0).values.tolist(), ['b', 'a'])
+        self.assertEqual(post.index_at_depth(1).values.tolist(), [3, 0])
+
+    def test_index_hierarchy_intersection_unaligned(self) -> None:
+        ih1 = IndexHierarchy.from_product(('a', 'b'), (1, 2, 3))
+        ih2 = IndexHierarchy.from_product(('b', 'c'), (1.0, 3.0))
+
+        post = index_hierarchy_intersection(ih1, ih2)
+        self.assertEqual(set(post), {('b', 1), ('b', 3)})
+
+    def test_index_hierarchy_intersection_reference_nan(self) -> None:
+        ih1 = IndexHierarchy.from_labels(((np.nan, 'a'), (1.0, 'b'), (2.0, 'a')))
+        ih2 = IndexHierarchy.from_labels(((2.0, 'a'), (np.nan, 'a'), (1.0, 'b'), (5.0, 'a')))
+        ih3 = IndexHierarchy.from_labels(((2.0, 'a'), (np.nan, 'b'), (1.0, 'b')))
+
+        post1 = index_hierarchy_intersection(ih1, ih2)
+        self.assertEqual(len(post1), 3)
+        self.assertEqual(np.isnan(post1.values_at_depth(0).astype(float)).sum(), 1)
+
+        post2 = index_hierarchy_intersection(ih2, ih1)
+        self.assertEqual(len(post2), 3)
+
+        post3 = index_hierarchy_intersection(ih1, ih3)
+        self.assertEqual(set(post3), {(1.0, 'b'), (2.0, 'a')})
+
+    def test_index_hierarchy_intersection_reference_nat(self) -> None:
+        ih1 = IndexHierarchy.from_labels(
+                ((np.datetime64('NaT', 'D'), 'a'), (np.datetime64('2020-01-01'), 'b')),
+                index_constructors=(IndexDate, Index),
+                )
+        ih2 = IndexHierarchy.from_labels(
+                ((np.datetime64('2020-01-01'), 'b'), (np.datetime64('NaT', 'D'), 'a'), (np.datetime64('2021-01-01'), 'a')),
+                index_constructors=(IndexDate, Index),
+                )
+        post1 = index_hierarchy_intersection(ih1, ih2)
+        self.assertEqual(len(post1), 2)
+
+        post2 = index_hierarchy_intersection(ih2, ih1)
+        self.assertEqual(len(post2), 2)
+        self.assertEqual(np.isnat(post2.values_at_depth(0)).sum(), 1)
+
     def test_index_hierarchy_difference(self) -> None:
         '''
         NOTE: This test only exists to prove that the new difference function returns the
@@ -90,6 +142,22 @@ class TestUnit(TestCase):
 
         self.assertTrue(actual.equals(expected), msg=(expected.rename("expected"), actual.rename("actual")))
 
+    def test_index_hierarchy_set_operations_overflow(self) -> None:
+        # nine depths of 300+ unique labels require more than 64 bits to encode
+        labels = [tuple(i + d for d in range(9)) for i in range(300)]
+        ih1 = IndexHierarchy.from_labels(labels)
+        ih2 = IndexHierarchy.from_labels(labels[100:] + [tuple(range(1000, 1009))])
+
+        post1 = index_hierarchy_union(ih1, ih2)
+        self.assertEqual(len(post1), 301)
+        self.assertEqual(set(post1), set(labels) | {tuple(range(1000, 1009))})
+
+        post2 = index_hierarchy_intersection(ih1, ih2)
+        self.assertEqual(set(post2), set(labels[100:]))
+
+        post3 = index_hierarchy_difference(ih1, ih2)
+        self.assertEqual(set(post3), set(labels[:100]))
+
 
 if __name__ == '__main__':
     unittest.main()
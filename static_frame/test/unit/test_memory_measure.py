@@ -129,6 +129,22 @@ class TestUnit(TestCase):
         obj = A()
         self.assertEqual(frozenset(_iter_slots(obj)), frozenset(('a', 'b', 'e')))
 
+    def test_sizable_slot_attrs_initialized_per_instance(self) -> None:
+        class A:
+            __slots__ = (
+                'apples',
+                'bananas',
+                '__weakref__',
+            )
+        obj1 = A()
+        obj1.apples = 'a'
+        obj2 = A()
+        obj2.bananas = 'b'
+        self.assertEqual(tuple(_iter_slots(obj1)), ('a',))
+        self.assertEqual(tuple(_iter_slots(obj2)), ('b',))
+        del obj1.apples
+        self.assertEqual(tuple(_iter_slots(obj1)), ())
+
     def test_sizable_slot_attrs_inheritance_1_layer(self) -> None:
         class A:
             __slots__ = (
@@ -305,6 +321,14 @@ class TestUnit(TestCase):
         obj = FrozenAutoMap([2, 3, 4])
         self.assertEqual(tuple(nested_sizable_elements(obj, seen=set())), (obj,))
 
+    def test_nested_sizable_elements_deep(self) -> None:
+        obj: tp.Any = ()
+        for _ in range(5000):
+            obj = (obj,)
+        post = tuple(nested_sizable_elements(obj, seen=set()))
+        self.assertEqual(len(post), 5001)
+        self.assertIs(post[-1], obj)
+
     #---------------------------------------------------------------------------
     def test_measure_format_a(self) -> None:
         empty: NDArrayAny = np.array(())
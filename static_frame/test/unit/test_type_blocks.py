@@ -1593,6 +1593,23 @@ class TestUnit(TestCase):
         self.assertEqual(tb1.transpose().transpose().values.tolist(),
                 tb1.values.tolist())
 
+    def test_type_blocks_transpose_b(self) -> None:
+
+        a1 = np.arange(6).reshape(3, 2)
+        a1.flags.writeable = False
+        tb1 = TypeBlocks.from_blocks((a1,))
+
+        tb2 = tb1.transpose()
+        self.assertEqual(tb2.shape, (2, 3))
+        self.assertEqual(tb2.values.tolist(), [[0, 2, 4], [1, 3, 5]])
+        # a single block is transposed as a view
+        self.assertTrue(np.shares_memory(tb2._blocks[0], a1))
+        self.assertFalse(tb2._blocks[0].flags.writeable)
+
+        tb3 = TypeBlocks.from_blocks((np.array(['a', 'b']),)).transpose()
+        self.assertEqual(tb3.shape, (1, 2))
+        self.assertEqual(tb3.values.tolist(), [['a', 'b']])
+
     #---------------------------------------------------------------------------
 
     def test_type_blocks_display_a(self) -> None:
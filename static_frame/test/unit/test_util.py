@@ -40,6 +40,7 @@ from static_frame.core.util import argmax_1d
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argsort_head
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
@@ -63,6 +64,8 @@ from static_frame.core.util import is_objectable_dt64
 from static_frame.core.util import is_strict_int
 from static_frame.core.util import isfalsy_array
 from static_frame.core.util import isin
+from static_frame.core.util import isin_kinds_comparable
+from static_frame.core.util import isin_partition_by_kind
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_2d
@@ -998,6 +1001,27 @@ class TestUnit(TestCase):
         arr_1d = np.array([1, 2, 3, 4, 5])
         with self.assertRaises(ValueError):
             _isin_2d(arr_1d, s3)
+
+    def test_isin_partition_by_kind_a(self) -> None:
+        post = isin_partition_by_kind(np.array(['a', 73, 30, 2.5, True], dtype=object))
+        self.assertEqual(sorted(post.keys()), ['U', 'b', 'f', 'i'])
+        self.assertEqual(post['i'].tolist(), [73, 30])
+        self.assertEqual(post['U'].tolist(), ['a'])
+        self.assertFalse(post['i'].flags.writeable)
+
+        self.assertIsNone(isin_partition_by_kind(np.array(['a', None], dtype=object)))
+        self.assertIsNone(isin_partition_by_kind(np.array(['a', (1, 2)], dtype=object)))
+        self.assertIsNone(isin_partition_by_kind(np.array(['a', np.datetime64('2020')], dtype=object)))
+        self.assertIsNone(isin_partition_by_kind(np.array([1, np.timedelta64(1, 's')], dtype=object)))
+
+    def test_isin_kinds_comparable_a(self) -> None:
+        self.assertTrue(isin_kinds_comparable('i', 'f'))
+        self.assertTrue(isin_kinds_comparable('b', 'u'))
+        self.assertTrue(isin_kinds_comparable('M', 'M'))
+        self.assertFalse(isin_kinds_comparable('U', 'S'))
+        self.assertFalse(isin_kinds_comparable('U', 'i'))
+        self.assertFalse(isin_kinds_comparable('M', 'm'))
+
     #---------------------------------------------------------------------------
 
     def test_array_shift_a(self) -> None:
@@ -2056,6 +2080,35 @@ class TestUnit(TestCase):
                 [2, 0]
                 )
 
+    def test_argsort_head_a(self) -> None:
+        a1 = np.array([3, 1, np.nan, 1, 5, 3, np.nan, 0])
+
+        self.assertEqual(argsort_head(a1, 3).tolist(), [7, 1, 3])
+        self.assertEqual(argsort_head(a1, 4).tolist(), [7, 1, 3, 0])
+        self.assertEqual(argsort_head(a1, 2, ascending=False).tolist(), [6, 2])
+        self.assertEqual(argsort_head(a1, 4, ascending=False).tolist(), [6, 2, 4, 5])
+        self.assertEqual(argsort_head(a1, 0).tolist(), [])
+        self.assertEqual(argsort_head(a1, 20).tolist(), [7, 1, 3, 0, 5, 4, 2, 6])
+
+    def test_argsort_head_b(self) -> None:
+        a1 = np.array(['c', 'a', 'b', 'a', 'c'])
+
+        for count in range(len(a1) + 1):
+            order = np.argsort(a1, kind='mergesort')
+            self.assertEqual(argsort_head(a1, count).tolist(), order[:count].tolist())
+            self.assertEqual(argsort_head(a1, count, ascending=False).tolist(),
+                    order[::-1][:count].tolist())
+
+    def test_argmin_2d_c(self) -> None:
+        a1 = np.array([[np.nan, 2, -1], [-1, np.nan, 20]])
+        a2 = np.array([[3, 2, -1], [-1, 0, 20]])
+
+        # all results are immutable
+        self.assertFalse(argmin_2d(a1, axis=1, skipna=False).flags.writeable)
+        self.assertFalse(argmin_2d(a1, axis=1, skipna=True).flags.writeable)
+        self.assertFalse(argmin_2d(a1, axis=0, skipna=False).flags.writeable)
+        self.assertFalse(argmin_2d(a2, axis=0).flags.writeable)
+
     def test_argmax_2d_a(self) -> None:
         a1 = np.array([[1, 2, -1], [-1, np.nan, 20]])
 